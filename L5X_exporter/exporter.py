@@ -1,5 +1,7 @@
 """Main L5X exporter with builder pattern API."""
 
+import xml.etree.ElementTree as ET
+
 from .validators import L5XValidator, L5XExportError
 from .id_manager import IDManager
 from .layout import LayoutCalculator
@@ -122,6 +124,18 @@ class L5XExporter:
         Returns:
             L5X XML string
 
+        Raises:
+            L5XExportError: If export fails
+        """
+        root = self.to_element()
+        return self._xml_builder.to_string(root)
+
+    def to_element(self) -> ET.Element:
+        """Export SFC to an L5X element tree without serializing it.
+
+        Returns:
+            Root Element of the L5X document
+
         Raises:
             L5XExportError: If export fails
         """
@@ -134,8 +148,8 @@ class L5XExporter:
         # Step 3: Calculate layout
         self._calculate_layout()
 
-        # Step 4: Build XML
-        return self._build_xml()
+        # Step 4: Build XML tree
+        return self._build_tree()
 
     def _allocate_ids(self):
         """Allocate IDs for all SFC elements."""
@@ -165,6 +179,11 @@ class L5XExporter:
 
     def _build_xml(self) -> str:
         """Build L5X XML string."""
+        root = self._build_tree()
+        return self._xml_builder.to_string(root)
+
+    def _build_tree(self) -> ET.Element:
+        """Build L5X XML tree."""
         self._xml_builder = L5XBuilder(
             self.sfc, self._id_manager, self._layout
         )
@@ -172,5 +191,4 @@ class L5XExporter:
         self._xml_builder.set_controller_name(self._controller_name)
         self._xml_builder.set_software_revision(self._software_revision)
 
-        root = self._xml_builder.build()
-        return self._xml_builder.to_string(root)
+        return self._xml_builder.build()
@@ -51,12 +51,14 @@ class LayoutCalculator:
         # Build branch lookup for faster access
         self._diverge_branches = {}  # root element -> diverge branch
         self._converge_branches = {}  # root element -> converge branch
+        self._converge_by_flow = {}  # flow type -> first converge branch with a root
 
         for branch in self.sfc.branches:
             if branch.branch_type == "DIVERGE" and branch.root:
                 self._diverge_branches[branch.root] = branch
             elif branch.branch_type == "CONVERGE" and branch.root:
                 self._converge_branches[branch.root] = branch
+                self._converge_by_flow.setdefault(branch.flow_type, branch)
 
         # Start layout from initial step
         self._layout_from_step(
@@ -181,25 +183,21 @@ class LayoutCalculator:
         # Look for corresponding converge branch
         converge_y = max_leg_y + TRANSITION_HEIGHT
 
-        # Find converge branch if exists
-        for conv_branch in self.sfc.branches:
-            if (conv_branch.branch_type == "CONVERGE" and
-                conv_branch.flow_type == branch.flow_type):
-                # Check if legs match (simplified check)
-                if conv_branch.root:
-                    self._branch_positions[conv_branch] = converge_y
-                    # Layout element after converge
-                    if conv_branch.root not in visited_steps and hasattr(conv_branch.root, 'is_initial'):
-                        converge_y = self._layout_from_step(
-                            conv_branch.root, x, converge_y + TRANSITION_HEIGHT,
-                            visited_steps, visited_transitions
-                        )
-                    elif conv_branch.root not in visited_transitions and hasattr(conv_branch.root, 'condition'):
-                        converge_y = self._layout_from_transition(
-                            conv_branch.root, x, converge_y + TRANSITION_HEIGHT,
-                            visited_steps, visited_transitions
-                        )
-                    break
+        # Find converge branch if exists (matched on flow type, simplified check)
+        conv_branch = self._converge_by_flow.get(branch.flow_type)
+        if conv_branch is not None:
+            self._branch_positions[conv_branch] = converge_y
+            # Layout element after converge
+            if conv_branch.root not in visited_steps and hasattr(conv_branch.root, 'is_initial'):
+                converge_y = self._layout_from_step(
+                    conv_branch.root, x, converge_y + TRANSITION_HEIGHT,
+                    visited_steps, visited_transitions
+                )
+            elif conv_branch.root not in visited_transitions and hasattr(conv_branch.root, 'condition'):
+                converge_y = self._layout_from_transition(
+                    conv_branch.root, x, converge_y + TRANSITION_HEIGHT,
+                    visited_steps, visited_transitions
+                )
 
         return converge_y
 
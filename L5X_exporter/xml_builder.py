@@ -264,6 +264,8 @@ class L5XBuilder:
 
     def _build_steps(self, sfc_content: ET.Element):
         """Build Step elements in SFCContent."""
+        add_link = self._directed_links.append
+        get_transition_id = self.id_manager.get_transition_id
         for step in self.sfc.steps:
             step_id = self.id_manager.get_step_id(step)
             operand = self.id_manager.get_step_operand(step)
@@ -312,12 +314,14 @@ class L5XBuilder:
 
             # Register directed links from step to outgoing transitions
             for trans in step.outgoing_transitions:
-                trans_id = self.id_manager.get_transition_id(trans)
+                trans_id = get_transition_id(trans)
                 if trans_id is not None:
-                    self._directed_links.append((step_id, trans_id))
+                    add_link((step_id, trans_id))
 
     def _build_transitions(self, sfc_content: ET.Element):
         """Build Transition elements in SFCContent."""
+        add_link = self._directed_links.append
+        get_step_id = self.id_manager.get_step_id
         for trans in self.sfc.transitions:
             trans_id = self.id_manager.get_transition_id(trans)
             operand = self.id_manager.get_transition_operand(trans)
@@ -348,14 +352,21 @@ class L5XBuilder:
 
             # Register directed links from transition to outgoing steps
             for step in trans.outgoing_steps:
-                step_id = self.id_manager.get_step_id(step)
+                step_id = get_step_id(step)
                 if step_id is not None:
-                    self._directed_links.append((trans_id, step_id))
+                    add_link((trans_id, step_id))
 
     def _build_branches(self, sfc_content: ET.Element):
         """Build Branch elements in SFCContent."""
+        add_link = self._directed_links.append
+        get_step_id = self.id_manager.get_step_id
+        get_transition_id = self.id_manager.get_transition_id
+        get_leg_id = self.id_manager.get_leg_id
+        get_branch_id = self.id_manager.get_branch_id
         for branch in self.sfc.branches:
-            branch_id = self.id_manager.get_branch_id(branch)
+            branch_id = get_branch_id(branch)
+            # Resolved once per branch, reused by the Leg elements and links
+            leg_ids = [get_leg_id(leg) for leg in branch.legs]
             y = self.layout.get_branch_y(branch)
 
             # Map flow type to L5X branch type
@@ -382,8 +393,7 @@ class L5XBuilder:
                 branch_elem.set("Priority", "Default")
 
             # Add legs
-            for leg in branch.legs:
-                leg_id = self.id_manager.get_leg_id(leg)
+            for leg_id in leg_ids:
                 ET.SubElement(branch_elem, "Leg", ID=str(leg_id))
 
             # Create directed links for branches
@@ -391,66 +401,57 @@ class L5XBuilder:
                 # Link from root element to diverge branch
                 root_id = None
                 if hasattr(branch.root, 'is_initial'):  # Step
-                    root_id = self.id_manager.get_step_id(branch.root)
+                    root_id = get_step_id(branch.root)
                 elif hasattr(branch.root, 'condition'):  # Transition
-                    root_id = self.id_manager.get_transition_id(branch.root)
+                    root_id = get_transition_id(branch.root)
 
                 if root_id is not None:
-                    self._directed_links.append((root_id, branch_id))
+                    add_link((root_id, branch_id))
 
                 # Link from legs to first elements in each leg
-                for leg in branch.legs:
-                    leg_id = self.id_manager.get_leg_id(leg)
+                for leg, leg_id in zip(branch.legs, leg_ids):
                     elements = leg.elements_sorted_by_line_number()
                     if elements:
                         first_elem = elements[0]
                         first_id = None
                         if hasattr(first_elem, 'is_initial'):  # Step
-                            first_id = self.id_manager.get_step_id(first_elem)
+                            first_id = get_step_id(first_elem)
                         elif hasattr(first_elem, 'condition'):  # Transition
-                            first_id = self.id_manager.get_transition_id(first_elem)
+                            first_id = get_transition_id(first_elem)
 
                         if first_id is not None:
-                            self._directed_links.append((leg_id, first_id))
+                            add_link((leg_id, first_id))
 
             elif branch.branch_type == "CONVERGE":
                 # Link from legs to converge branch
-                for leg in branch.legs:
-                    leg_id = self.id_manager.get_leg_id(leg)
+                for leg, leg_id in zip(branch.legs, leg_ids):
                     elements = leg.elements_sorted_by_line_number()
                     if elements:
                         last_elem = elements[-1]
                         last_id = None
                         if hasattr(last_elem, 'is_initial'):  # Step
-                            last_id = self.id_manager.get_step_id(last_elem)
+                            last_id = get_step_id(last_elem)
                         elif hasattr(last_elem, 'condition'):  # Transition
-                            last_id = self.id_manager.get_transition_id(last_elem)
+                            last_id = get_transition_id(last_elem)
 
                         if last_id is not None:
-                            self._directed_links.append((last_id, leg_id))
+                            add_link((last_id, leg_id))
 
                 # Link from converge branch to root element
                 if branch.root:
                     root_id = None
                     if hasattr(branch.root, 'is_initial'):  # Step
-                        root_id = self.id_manager.get_step_id(branch.root)
+                        root_id = get_step_id(branch.root)
                     elif hasattr(branch.root, 'condition'):  # Transition
-                        root_id = self.id_manager.get_transition_id(branch.root)
+                        root_id = get_transition_id(branch.root)
 
                     if root_id is not None:
-                        self._directed_links.append((branch_id, root_id))
+                        add_link((branch_id, root_id))
 
     def _build_directed_links(self, sfc_content: ET.Element):
         """Build DirectedLink elements."""
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_links = []
-        for link in self._directed_links:
-            if link not in seen:
-                seen.add(link)
-                unique_links.append(link)
-
-        for from_id, to_id in unique_links:
+        # Remove duplicates while preserving order (dicts keep insertion order)
+        for from_id, to_id in dict.fromkeys(self._directed_links):
             ET.SubElement(
                 sfc_content, "DirectedLink",
                 FromID=str(from_id),
@@ -45,18 +45,41 @@ class ErrorCollector:
 
     This allows the parser to continue collecting errors instead of
     failing on the first one, providing better user feedback.
+
+    An error with the same line number and message as one already added
+    through add() or record() is skipped, so a cascading failure is
+    reported once.
     """
 
     def __init__(self):
         self.errors = []
+        self._seen = set()  # (line_number, message) of collected errors
 
     def add(self, error: SFCError):
-        """Add an error to the collection.
+        """Add an error to the collection, unless it is a duplicate.
 
         Args:
             error: SFCError instance to add
         """
-        self.errors.append(error)
+        key = (error.line_number, error.message)
+        if key not in self._seen:
+            self._seen.add(key)
+            self.errors.append(error)
+
+    def record(self, message: str, line_number: int = None, error_class=ParseError):
+        """Add an error from its parts, unless it is a duplicate.
+
+        The exception object is only built for errors that are kept.
+
+        Args:
+            message: Error description
+            line_number: Optional line number where error occurred (1-indexed)
+            error_class: SFCError subclass to instantiate
+        """
+        key = (line_number, message)
+        if key not in self._seen:
+            self._seen.add(key)
+            self.errors.append(error_class(message, line_number))
 
     def has_errors(self):
         """Return True if any errors have been collected."""
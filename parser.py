@@ -5,11 +5,53 @@ This module provides syntactic and semantic analysis for QuickSFC
 (.qsfc) files, building SFC objects from token streams.
 """
 
+import sys
+from bisect import bisect_left
+from itertools import pairwise
 from typing import List
 from .tokenizer import Tokenizer, TokenType
 from .sfc import SFC, Step, Transition, Branch, Leg
 from .errors import ErrorCollector, ParseError, TokenizeError, ValidationError
 
+# TokenType members bound at module level for the parser hot path
+_TT_SI = TokenType.SI
+_TT_S = TokenType.S
+_TT_T = TokenType.T
+_TT_END = TokenType.END
+_TT_AT = TokenType.AT
+_TT_NAME = TokenType.NAME
+_TT_LPAREN = TokenType.LPAREN
+_TT_RPAREN = TokenType.RPAREN
+_TT_COMMA = TokenType.COMMA
+_TT_ACTION = TokenType.ACTION
+_TT_CONDITION = TokenType.CONDITION
+_TT_NUMBER = TokenType.NUMBER
+_TT_COMMENT = TokenType.COMMENT
+_TT_HASH = TokenType.HASH
+_TT_JUMP = TokenType.JUMP
+_TT_LEG_SEPARATOR = TokenType.LEG_SEPARATOR
+_TT_OR_DIVERGE = TokenType.OR_DIVERGE
+_TT_OR_CONVERGE = TokenType.OR_CONVERGE
+_TT_AND_DIVERGE = TokenType.AND_DIVERGE
+_TT_AND_CONVERGE = TokenType.AND_CONVERGE
+_TT_NEWLINE = TokenType.NEWLINE
+_TT_EOF = TokenType.EOF
+
+# Tokens that can start or end a statement, where error recovery resumes
+_SYNC_TOKENS = frozenset({
+    _TT_NEWLINE, _TT_END, _TT_EOF,
+    _TT_SI, _TT_S, _TT_T,
+    _TT_LEG_SEPARATOR,
+    _TT_OR_DIVERGE, _TT_OR_CONVERGE, _TT_AND_DIVERGE, _TT_AND_CONVERGE,
+})
+
+
+class _RecoverBoundary(Exception):
+    """Raised after recording an error that leaves a statement unparseable.
+
+    Caught at statement boundaries, which skip to the next statement and resume.
+    """
+
 
 class Parser:
     """Parser for QuickSFC language.
@@ -28,6 +70,9 @@ class Parser:
         self.tokenizer = Tokenizer(content)
         self.tokens = []
         self.current = 0
+        self._token_types = []  # TokenType of each token, parallel to self.tokens
+        self._positions_by_type = {}  # Map: TokenType -> sorted token indices
+        self._eof_index = 0  # Index of the EOF token; tokens before it are in play
 
         # Parsing state
         self.steps = []  # List[Step] - ordered by appearance
@@ -36,7 +81,9 @@ class Parser:
         self.name_to_step = {}  # Map: name -> Step
         self.name_to_transition = {}  # Map: name -> Transition
         self.errors = ErrorCollector()
+        self._dirty = False  # Set by _record_error; avoids polling self.errors
         self.current_step = None  # Track current step for transition linking
+        self.has_initial_step = False  # Set once the first SI has been parsed
         self.file_comments = {} #key is line number
 
         # ID counter state
@@ -45,6 +92,17 @@ class Parser:
         self.inside_branch = False  # Flag to track if we're inside a branch
         self.after_convergence = False  # Flag to skip from_step linking after convergence
 
+        # Statement dispatch for _parse_file: TokenType -> handler
+        self._statement_handlers = {
+            _TT_SI: self._parse_initial_step_statement,
+            _TT_S: self._parse_step_statement,
+            _TT_T: self._parse_transition,
+            _TT_OR_DIVERGE: self._parse_branch,
+            _TT_AND_DIVERGE: self._parse_branch,
+            _TT_LEG_SEPARATOR: self._advance,  # Standalone | without branch context - skip
+            _TT_HASH: self._parse_comment,
+        }
+
     def parse(self):
         """Parse the .qsfc file and return SFC object.
 
@@ -57,26 +115,21 @@ class Parser:
         #  Tokenization
         try:
             self.tokens = self.tokenizer.tokenize()
+            self._index_token_positions()
         except TokenizeError as e:
             self.errors.add(e)
             self.errors.raise_if_errors()
 
-        # Syntax validation, object construction, bidirectional links
-        if not self.errors.has_errors():
-            self._parse_file()
-
-        #linking jumps after transitions
-        if not self.errors.has_errors():
-            self._handle_jumps()
-
-        #linking comments
-        if not self.errors.has_errors():
-            self._link_comments()
-
-        #  Validation
-        if not self.errors.has_errors():
-            pass
-            self._validate()
+        phases = (
+            self._parse_file,     # Syntax validation, object construction, bidirectional links
+            self._handle_jumps,   # Linking jumps after transitions
+            self._link_comments,  # Linking comments
+            self._validate,       # Validation
+        )
+        for phase in phases:
+            phase()
+            if self._dirty:
+                break
 
         # Raise if any errors collected
         self.errors.raise_if_errors()
@@ -99,145 +152,150 @@ class Parser:
         self._skip_newlines()
 
         # # First meaningful token must be SI
-        # if not self._check(TokenType.SI):
+        # if not self._check(_TT_SI):
         #     self._record_error(
         #         "First line must be SI() (initial step)",
         #         self._current_token().line_number if self._current_token() else 1
         #     )
         #     # Try to recover by finding SI
-        #     while not self._at_end() and not self._check(TokenType.SI):
+        #     while not self._at_end() and not self._check(_TT_SI):
         #         self._advance()
 
         # Parse statements until END or EOF
-        while not self._at_end() and not self._check(TokenType.END):
+        handlers = self._statement_handlers
+        while True:
             self._skip_newlines()
 
-            if self._at_end() or self._check(TokenType.END):
+            token_type = self._token_types[self.current]
+            if token_type is _TT_END or token_type is _TT_EOF:
                 break
-            
 
-                    
-            # Parse SI, S, or T
-            if self._check(TokenType.SI):
-                self._parse_initial_step()
-                # Check if step is followed by divergence operator
-                self._skip_newlines()
-                if self._check(TokenType.OR_DIVERGE) or self._check(TokenType.AND_DIVERGE):
-                    self._parse_branch()
-            elif self._check(TokenType.S):
-                self._parse_step()
-                # Check if step is followed by divergence operator
-                self._skip_newlines()
-                if self._check(TokenType.OR_DIVERGE) or self._check(TokenType.AND_DIVERGE):
-                    self._parse_branch()
-            elif self._check(TokenType.T):
-                self._parse_transition()
-            elif self._check(TokenType.OR_DIVERGE) or self._check(TokenType.AND_DIVERGE):
-                self._parse_branch()
-            elif self._check(TokenType.LEG_SEPARATOR):
-                # Standalone | without branch context - skip
-                self._advance()
-            elif self._check(TokenType.HASH):
-                #If the line only contains a comment, we store it
-                if self._check_behind(TokenType.NEWLINE):
-                    self._advance()  # Skip HASH
-                    self.file_comments[self._current_token().line_number] = self._consume(TokenType.COMMENT)
-                    self._skip_newlines()
-                # if we are after another token, we keep it in the dict
-                else:
-                    self._advance()
-                    self.file_comments[self._current_token().line_number] = self._consume(TokenType.COMMENT)
-                    self._skip_newlines() 
-            
-                 
-            else:
+            handler = handlers.get(token_type)
+            if handler is None:
                 # Unexpected token
-                token = self._current_token()
+                token = self.tokens[self.current]
                 self._record_error(
                     f"Expected S, SI, T, or END, got {token.type.name}",
                     token.line_number
                 )
                 self._advance()  # Skip to recover
+            else:
+                try:
+                    handler()
+                except _RecoverBoundary:
+                    self._synchronize()
 
         # Check for END marker
         self._skip_newlines()
-        if not self._check(TokenType.END):
+        if not self._check(_TT_END):
             last_line = self.tokens[-2].line_number if len(self.tokens) >= 2 else 1
             self._record_error(
                 "Missing END marker at end of file",
                 last_line
             )
 
+    def _parse_initial_step_statement(self):
+        """Parse SI@name(...) and a divergence directly following it."""
+        self._parse_initial_step()
+        self._parse_trailing_divergence()
+
+    def _parse_step_statement(self):
+        """Parse S@name(...) and a divergence directly following it."""
+        self._parse_step()
+        self._parse_trailing_divergence()
+
+    def _parse_trailing_divergence(self):
+        """Parse a branch if the step just parsed is followed by /\\ or //\\\\."""
+        self._skip_newlines()
+        token_type = self._token_types[self.current]
+        if token_type is _TT_OR_DIVERGE or token_type is _TT_AND_DIVERGE:
+            self._parse_branch()
+
     def _parse_comment(self):
-        line_number = self._current_token().line_number
+        """Parse # COMMENT and store it by line number.
+
+        Comments alone on a line and comments after another statement are
+        both kept in file_comments; _link_comments attaches the latter.
+        """
+        self._advance()  # Skip HASH
+        line_number = self._current_line(self.tokens[-1].line_number)
+        comment = self._consume(_TT_COMMENT)
+        if comment is not None:
+            self.file_comments[line_number] = comment
+        self._skip_newlines()
 
     def _parse_initial_step(self):
         """Parse SI@name(ACTION, [PRESET])"""
         line_number = self._current_token().line_number
 
         # Check if SI already parsed
-        if any(step.is_initial for step in self.steps):
+        if self.has_initial_step:
             self._record_error(
                 "Only one SI@name() (initial step) allowed",
                 line_number
             )
-        self._parse_step()
-        self.last_parsed_element.is_initial = True
+        try:
+            step = self._parse_step()
+            step.is_initial = True
+        finally:
+            self.has_initial_step = True
         
 
     def _parse_step(self):
-        """Parse S@name(ACTION, [PRESET])"""
+        """Parse S@name(ACTION, [PRESET])
+
+        Returns:
+            The new Step
+
+        Raises:
+            _RecoverBoundary: If the statement is malformed (error recorded)
+        """
         line_number = self._current_token().line_number
-        self._advance()  # Consume S
-        comments = []
+        self.current += 1  # Consume S
+        comment = None
         action = None
         # Expect @ symbol
-        if not self._expect(TokenType.AT):
-            return
+        self._expect(_TT_AT)
 
         # Expect NAME token
-        if not self._check(TokenType.NAME):
+        token = self._current_token()
+        if token is None or token.type is not _TT_NAME:
             self._record_error(
-                f"Expected name after @, got {self._current_token().type.name if self._current_token() else 'EOF'}",
-                self._current_token().line_number if self._current_token() else line_number
+                f"Expected name after @, got {token.type.name if token else 'EOF'}",
+                token.line_number if token else line_number
             )
             name = f"unnamed_s_{len(self.steps)}"
         else:
-            name = self._current_token().value
-            self._advance()
-
-        # Check for duplicate names
-        if name in self.name_to_step:
-            self._record_error(
-                f"Duplicate step name '@{name}'",
-                line_number
-            )
+            name = token.value  # Interned by the tokenizer
+            self.current += 1
 
         # Expect (
-        if not self._expect(TokenType.LPAREN):
-            return
+        self._expect(_TT_LPAREN)
 
         # Expect ACTION or COMMENT token
-        if self._check(TokenType.ACTION):
-            action = self._current_token().value
-            self._advance()
-        if self._check(TokenType.COMMENT):
-            comments.append(self._current_token().value)
-            self._advance()
+        token = self._current_token()
+        if token is not None and token.type is _TT_ACTION:
+            action = token.value
+            self.current += 1
+            token = self._current_token()
+        if token is not None and token.type is _TT_COMMENT:
+            comment = token.value
+            self.current += 1
 
         # Check for optional preset
         preset = 0
-        if self._check(TokenType.COMMA):
-            self._advance()  # Consume comma
+        if self._token_types[self.current] is _TT_COMMA:
+            self.current += 1  # Consume comma
             preset = self._parse_number()
             if preset is None:
                 preset = 0  # Error already recorded
 
         # Expect )
-        if not self._expect(TokenType.RPAREN):
-            return
+        self._expect(_TT_RPAREN)
 
         # Create step object
+        # Comments list stays mutable: _link_comments may append trailing comments
+        comments = [comment] if comment is not None else []
         step = Step(name, action, preset, line_number, comments=comments, is_initial=False)
 
         # Assign IDs
@@ -251,12 +309,25 @@ class Parser:
             preceding_transition.add_outgoing_step(step)
 
         self.steps.append(step)
-        self.name_to_step[name] = step
+        # Single lookup both registers the name and detects duplicates (first wins)
+        if self.name_to_step.setdefault(name, step) is not step:
+            self._record_error(
+                f"Duplicate step name '@{name}'",
+                line_number
+            )
         self.current_step = step
         self.last_parsed_element = step  # Track for branch linking
+        return step
 
     def _parse_transition(self):
-        """Parse T@name(CONDITION) [>> @target]"""
+        """Parse T@name(CONDITION) [>> @target]
+
+        Returns:
+            The new Transition
+
+        Raises:
+            _RecoverBoundary: If the statement is malformed (error recorded)
+        """
         line_number = self._current_token().line_number
         comment = None
 
@@ -267,70 +338,63 @@ class Parser:
                 line_number
             )
 
-        self._advance()  # Consume T
+        self.current += 1  # Consume T
 
         # Expect @ symbol
-        if not self._expect(TokenType.AT):
-            return
+        self._expect(_TT_AT)
 
         # Expect NAME token
-        if not self._check(TokenType.NAME):
+        token = self._current_token()
+        if token is None or token.type is not _TT_NAME:
             self._record_error(
-                f"Expected name after @, got {self._current_token().type.name if self._current_token() else 'EOF'}",
-                self._current_token().line_number if self._current_token() else line_number
+                f"Expected name after @, got {token.type.name if token else 'EOF'}",
+                token.line_number if token else line_number
             )
             name = f"unnamed_t_{len(self.transitions)}"
         else:
-            name = self._current_token().value
-            self._advance()
-
-        # Check for duplicate names
-        if name in self.name_to_transition:
-            self._record_error(
-                f"Duplicate transition name '@{name}'",
-                line_number
-            )
+            name = token.value  # Interned by the tokenizer
+            self.current += 1
 
         # Expect (
-        if not self._expect(TokenType.LPAREN):
-            return
+        self._expect(_TT_LPAREN)
 
         # Expect CONDITION token
-        if not self._check(TokenType.CONDITION):
+        token = self._current_token()
+        if token is None or token.type is not _TT_CONDITION:
             self._record_error(
-                f"Expected CONDITION, got {self._current_token().type.name if self._current_token() else 'EOF'}",
-                self._current_token().line_number if self._current_token() else line_number
+                f"Expected CONDITION, got {token.type.name if token else 'EOF'}",
+                token.line_number if token else line_number
             )
             condition = ""
         else:
-            condition = self._current_token().value
-            self._advance()
+            # Conditions such as "Step_001.DN" repeat across transitions
+            condition = sys.intern(token.value)
+            self.current += 1
 
         # Expect )
-        if not self._expect(TokenType.RPAREN):
-            return
+        self._expect(_TT_RPAREN)
 
         # Check for optional >> jump operator
         target_name = None
-        if self._check(TokenType.JUMP):
-            self._advance()  # Consume >>
+        if self._token_types[self.current] is _TT_JUMP:
+            self.current += 1  # Consume >>
             # Expect @ symbol
-            if not self._expect(TokenType.AT):
-                return
+            self._expect(_TT_AT)
             # Expect target NAME
-            if not self._check(TokenType.NAME):
+            token = self._current_token()
+            if token is None or token.type is not _TT_NAME:
                 self._record_error(
-                    f"Expected step name after >> @, got {self._current_token().type.name if self._current_token() else 'EOF'}",
-                    self._current_token().line_number if self._current_token() else line_number
+                    f"Expected step name after >> @, got {token.type.name if token else 'EOF'}",
+                    token.line_number if token else line_number
                 )
             else:
-                target_name = self._current_token().value
-                self._advance()
+                target_name = token.value  # Interned by the tokenizer
+                self.current += 1
         # #Check for a comment after transition definition
-        # while not self._check(TokenType.NEWLINE):
-        #     if self._check(TokenType.HASH):
+        # while not self._check(_TT_NEWLINE):
+        #     if self._check(_TT_HASH):
         #         self._advance()
-        #         if self._check(TokenType.COMMENT):
+        #         if self._check(_TT_COMMENT):
         #             comment = self._current_token().value
         #     self._advance()
                 
@@ -343,7 +407,12 @@ class Parser:
         transition.operand = len(self.transitions)  # Sequential transition counter: 0, 1, 2...
 
         self.transitions.append(transition)
-        self.name_to_transition[name] = transition
+        # Single lookup both registers the name and detects duplicates (first wins)
+        if self.name_to_transition.setdefault(name, transition) is not transition:
+            self._record_error(
+                f"Duplicate transition name '@{name}'",
+                line_number
+            )
 
 
         self.last_parsed_element = transition 
@@ -362,6 +431,8 @@ class Parser:
         if self.after_convergence:
             self.after_convergence = False
 
+        return transition
+
     def _parse_branch(self):
         """Parse branch structure: /\\ ... \\/ or //\\\\ ... \\\\//
 
@@ -383,10 +454,10 @@ class Parser:
         line_number = self._current_token().line_number
 
         # Determine branch type
-        is_and_branch = self._check(TokenType.AND_DIVERGE)
+        is_and_branch = self._check(_TT_AND_DIVERGE)
         flow_type = "AND" if is_and_branch else "OR"
-        diverge_token = TokenType.AND_DIVERGE if is_and_branch else TokenType.OR_DIVERGE
-        converge_token = TokenType.AND_CONVERGE if is_and_branch else TokenType.OR_CONVERGE
+        diverge_token = _TT_AND_DIVERGE if is_and_branch else _TT_OR_DIVERGE
+        converge_token = _TT_AND_CONVERGE if is_and_branch else _TT_OR_CONVERGE
 
         self._advance()  # Consume divergence operator
         self._skip_newlines()
@@ -408,14 +479,21 @@ class Parser:
         current_leg = Leg()
         diverge_branch.legs.append(current_leg)
 
-        while not self._at_end() and not self._check(converge_token) and not self._check(TokenType.END):
+        # Legs never consume a convergence operator, so the next one bounds the loop
+        converge_index = self._next_position(converge_token)
+
+        while True:
             self._skip_newlines()
+            if self.current >= converge_index:
+                break
 
-            if self._check(converge_token):
+            # Token stream always ends with EOF, so current is in range
+            token_type = self._token_types[self.current]
+            if token_type is _TT_END or token_type is _TT_EOF:
                 break
 
             # Check for leg separator
-            if self._check(TokenType.LEG_SEPARATOR):
+            if token_type is _TT_LEG_SEPARATOR:
                 self._advance()
                 self._skip_newlines()
 
@@ -426,76 +504,69 @@ class Parser:
                 continue
 
             # Parse leg content based on branch type
-            if self._check(TokenType.S):
-                # Parse step and add to current leg
-                step_before_count = len(self.steps)
-                self._parse_step()
-                # Add newly created step to leg
-                if len(self.steps) > step_before_count:
-                    current_leg.steps.append(self.steps[-1])
-
-            elif self._check(TokenType.T):
-                # Parse transition
-                trans_before_count = len(self.transitions)
-                self._parse_transition()
-                # Add newly created transition to leg
-                if len(self.transitions) > trans_before_count:
-                    current_leg.transitions.append(self.transitions[-1])
-
-                # For OR branches, check for -> operator
-                if not is_and_branch and self._check(TokenType.JUMP):
-                    self._advance()  # Consume ->
-                    self._skip_newlines()
-
-                    # Check for jump (-> @target)
-                    if self._check(TokenType.AT):
-                        # Jump to existing step: -> @target
-                        self._advance()  # Consume @
-                        if not self._check(TokenType.NAME):
-                            self._record_error(
-                                f"Expected step name after -> @",
-                                self._current_token().line_number if self._current_token() else line_number
-                            )
-                        else:
-                            target_name = self._current_token().value
-                            self._advance()
-                            # Set jump target on last transition in current leg
-                            if current_leg.transitions and len(current_leg.transitions) > 0:
-                                current_leg.transitions[-1].target_name = target_name
-                            else:
+            try:
+                if token_type is _TT_S:
+                    # Parse step and add to current leg
+                    step = self._parse_step()
+                    current_leg.add_step(step)
+
+                elif token_type is _TT_T:
+                    # Parse transition and add to current leg
+                    transition = self._parse_transition()
+                    current_leg.add_transition(transition)
+
+                    # For OR branches, check for -> operator
+                    if not is_and_branch and self._check(_TT_JUMP):
+                        self._advance()  # Consume ->
+                        self._skip_newlines()
+
+                        # Check for jump (-> @target)
+                        if self._check(_TT_AT):
+                            # Jump to existing step: -> @target
+                            self._advance()  # Consume @
+                            token = self._current_token()
+                            if token is None or token.type is not _TT_NAME:
                                 self._record_error(
-                                    f"-> @ jump must follow a transition",
-                                    self._current_token().line_number if self._current_token() else line_number
+                                    f"Expected step name after -> @",
+                                    token.line_number if token else line_number
                                 )
-
-                    elif self._check(TokenType.S):
-                        # Create new step: -> S@name(action)
-                        step_before_count = len(self.steps)
-                        self._parse_step()
-                        if len(self.steps) > step_before_count:
-                            current_leg.steps.append(self.steps[-1])
-                    else:
-                        self._record_error(
-                            f"Expected S@name or @target after -> in OR branch leg",
-                            self._current_token().line_number if self._current_token() else line_number
-                        )
-            elif self._check(TokenType.END):
-                # Reached END - exit loop
-                break
-            else:
-                # Unexpected token in branch
-                token = self._current_token()
-                self._record_error(
-                    f"Unexpected token in branch: {token.type.name}",
-                    token.line_number if token else line_number
-                )
-                self._advance()
+                            else:
+                                target_name = token.value  # Interned by the tokenizer
+                                self._advance()
+                                # Set jump target on last transition in current leg
+                                if current_leg.transitions:
+                                    current_leg.transitions[-1].target_name = target_name
+                                else:
+                                    self._record_error(
+                                        f"-> @ jump must follow a transition",
+                                        self._current_line(line_number)
+                                    )
+
+                        elif self._check(_TT_S):
+                            # Create new step: -> S@name(action)
+                            step = self._parse_step()
+                            current_leg.add_step(step)
+                        else:
+                            self._record_error(
+                                f"Expected S@name or @target after -> in OR branch leg",
+                                self._current_line(line_number)
+                            )
+                else:
+                    # Unexpected token in branch
+                    token = self._current_token()
+                    self._record_error(
+                        f"Unexpected token in branch: {token.type.name}",
+                        token.line_number if token else line_number
+                    )
+                    self._advance()
+            except _RecoverBoundary:
+                self._synchronize()
 
         # Validate branch structure according to IEC 61131-3
         if is_and_branch:
-            self._validate_and_divergence_structure(diverge_branch)
+            legs_valid = self._validate_and_divergence_structure(diverge_branch)
         else:  # OR branch
-            self._validate_or_divergence_structure(diverge_branch)
+            legs_valid = self._validate_or_divergence_structure(diverge_branch)
 
         # Check if all legs have jumps (for optional convergence)
         all_legs_jump = self._check_all_legs_have_jumps(diverge_branch)
@@ -510,14 +581,14 @@ class Parser:
                 converge_op = r"\//"
                 self._record_error(
                     f"Expected {converge_op} to close AND branch",
-                    self._current_token().line_number if self._current_token() else line_number
+                    self._current_line(line_number)
                 )
             elif not all_legs_jump:
                 # OR branches need convergence unless all legs jump
                 converge_op = r"\/"
                 self._record_error(
                     f"Expected {converge_op} to close OR branch, or ensure all legs jump (-> @target)",
-                    self._current_token().line_number if self._current_token() else line_number
+                    self._current_line(line_number)
                 )
             # If OR branch and all legs jump, convergence is optional - no error
         else:
@@ -526,7 +597,7 @@ class Parser:
             self._skip_newlines()
 
             # Create convergence branch
-            converge_branch = Branch("CONVERGE", flow_type, self._current_token().line_number if self._current_token() else line_number)
+            converge_branch = Branch("CONVERGE", flow_type, self._current_line(line_number))
 
             # Assign ID to convergence branch
             converge_branch.id = self._next_id()
@@ -536,7 +607,10 @@ class Parser:
                 converge_branch.legs = diverge_branch.legs
             else: 
                 #if a the last transition of a diverge branch leg has no jump, then it is a leg of the converge branch
-                converge_branch.legs =  list(filter(lambda leg: not(leg.transitions[-1].target_name), diverge_branch.legs))
+                converge_branch.legs = [
+                    leg for leg in diverge_branch.legs
+                    if leg.transitions and not leg.transitions[-1].target_name
+                ]
                 
 #this should be in creating directed steps
                     # if not has_jump:
@@ -555,17 +629,17 @@ class Parser:
             # Validate convergence follows IEC 61131-3 rules
             if is_and_branch:
                 # AND (parallel) convergence → Transition
-                if not self._check(TokenType.T):
+                if not self._check(_TT_T):
                     self._record_error(
                         f"AND convergence must be followed by a transition T@name",
-                        self._current_token().line_number if self._current_token() else line_number
+                        self._current_line(line_number)
                     )
             else:
                 # OR (selection) convergence → Step
-                if not self._check(TokenType.S):
+                if not self._check(_TT_S):
                     self._record_error(
                         f"OR convergence must be followed by a step S@name",
-                        self._current_token().line_number if self._current_token() else line_number
+                        self._current_line(line_number)
                     )
 
             # Reset inside_branch flag BEFORE parsing the element after convergence
@@ -578,32 +652,32 @@ class Parser:
 
             # Parse the element after convergence
             following_element = None
-            if self._check(TokenType.T):
-                trans_before_count = len(self.transitions)
-                self._parse_transition()
-                # Link convergence to this transition
-                if len(self.transitions) > trans_before_count:
-                    converge_branch.root = self.transitions[-1]
-                    following_element = self.transitions[-1]
-
-            elif self._check(TokenType.S):
-                step_before_count = len(self.steps)
-                self._parse_step()
-                # Link convergence to this step
-                if len(self.steps) > step_before_count:
-                    converge_branch.root = self.steps[-1]
-                    following_element = self.steps[-1]
+            try:
+                if self._check(_TT_T):
+                    transition = self._parse_transition()
+                    # Link convergence to this transition
+                    converge_branch.root = transition
+                    following_element = transition
+
+                elif self._check(_TT_S):
+                    step = self._parse_step()
+                    # Link convergence to this step
+                    converge_branch.root = step
+                    following_element = step
                     # Update current_step so next transition can link to it
-                    self.current_step = self.steps[-1]
+                    self.current_step = step
                     # Reset after_convergence flag now that we've parsed the step after convergence
                     # Next transitions should link normally to this step
                     self.after_convergence = False
+            except _RecoverBoundary:
+                self._synchronize()
             
             
            
 
 
-            for leg in converge_branch.legs:
+            # Malformed legs are not linked; their error is already recorded
+            for leg in (converge_branch.legs if legs_valid else ()):
                 if is_and_branch:
                     # add the transition the outgoing transitions of each last step of a leg and vice versa
                     root: Transition = converge_branch.get_root()
@@ -619,21 +693,22 @@ class Parser:
             self.branches.append(converge_branch)
         
         
-        for leg in diverge_branch.legs:
+        for leg in (diverge_branch.legs if legs_valid else ()):
         #adding links between elements of legs
-            for i in  range(len(leg.elements)-1):
-                from_elem:Step|Transition = leg.elements_sorted_by_line_number()[i]
-                to_elem:Step|Transition = leg.elements_sorted_by_line_number()[i+1]
-
-                if isinstance(from_elem,Step):
+            for from_elem, to_elem in pairwise(leg.elements_sorted_by_line_number()):
+                # Step and Transition are leaf classes, so an identity check is enough
+                from_type = type(from_elem)
+                if from_type is Step:
                     from_elem.add_outgoing_transition(to_elem)
                     to_elem.add_incoming_step(from_elem)
-                elif isinstance(from_elem,Transition):
+                elif from_type is Transition:
                     from_elem.add_outgoing_step(to_elem)
                     to_elem.add_incoming_transition(from_elem)
                 else:
                     self._record_error(
-                f"Unexpected type in branch leg, should be only steps or transitions")
+                        "Unexpected type in branch leg, should be only steps or transitions",
+                        diverge_branch.line_number
+                    )
             #now we link references between legs and root 
             if is_and_branch:    
                 root: Transition = diverge_branch.get_root()
@@ -698,12 +773,12 @@ class Parser:
                 )
                 return False
 
+            # Leg has at least one step here, so only transitions can be missing
+            if not leg.transitions:
+                continue
+
             # First element must be step
-            first_line = min(
-                leg.steps[0].line_number if leg.steps else float('inf'),
-                leg.transitions[0].line_number if leg.transitions else float('inf')
-            )
-            if leg.transitions and leg.transitions[0].line_number == first_line:
+            if leg.transitions[0].line_number <= leg.steps[0].line_number:
                 self._record_error(
                     f"AND divergence leg {i+1} must START with step, not transition",
                     leg.transitions[0].line_number
@@ -711,9 +786,7 @@ class Parser:
                 return False
 
             # Last element must be step
-            last_step_line = leg.steps[-1].line_number if leg.steps else 0
-            last_trans_line = leg.transitions[-1].line_number if leg.transitions else 0
-            if last_step_line < last_trans_line:
+            if leg.steps[-1].line_number < leg.transitions[-1].line_number:
                 self._record_error(
                     f"AND divergence leg {i+1} must END with step, not transition",
                     leg.steps[-1].line_number
@@ -740,23 +813,28 @@ class Parser:
         Returns:
             Integer value or None if error
         """
-        if not self._check(TokenType.NUMBER):
+        token = self._current_token()
+        if token is None or token.type is not _TT_NUMBER:
             self._record_error(
-                f"Expected number, got {self._current_token().type.name}",
-                self._current_token().line_number
+                f"Expected number, got {token.type.name if token else 'EOF'}",
+                token.line_number if token else self.tokens[-1].line_number
             )
             return None
 
-        number = self._current_token().value
         self._advance()
-        return number
+        return token.value
 
     def _handle_jumps(self):
         """Build bidirectional Step ↔ Transition relationships."""
-        elements_in_branches = []
-        for branch in self.branches:
-            elements_in_branches+=branch.elements_in_branch
+        # Only used for membership tests, so a set avoids list scans
+        elements_in_branches = {
+            element
+            for branch in self.branches
+            for element in branch.elements_in_branch
+        }
         
+        # Jump transitions grouped by target step, linked back in one pass
+        incoming = {}
         for transition in self.transitions:
             # from_step already set during parsing (for non-branch transitions)
 
@@ -771,7 +849,7 @@ class Parser:
                     )
                 else:
                     transition.add_outgoing_step(target_step)
-                    target_step.add_incoming_transition(transition)
+                    incoming.setdefault(target_step, []).append(transition)
             # elif transition not in elements_in_branches:
             #     next_step = self._find_next_step_from(transition.line_number)
             #     # Don't set to_step if next_step is inside a branch (connected via branch structure)
@@ -783,15 +861,29 @@ class Parser:
             #     elif next_step not in elements_in_branches:
             #         transition.add_outgoing_step(next_step)
 
+        for target_step, jump_transitions in incoming.items():
+            target_step.add_incoming_transitions(jump_transitions)
+
     def _link_comments(self,):
         "Link comments that are after a Transition or Step to it's respective owner"
-        for step in self.steps:
-            if step.line_number in self.file_comments:
-                step.comments.append(self.file_comments[step.line_number])
+        if not self.file_comments:
+            return
 
+        # Comments are sparse, so walk them once and look their owners up by line;
+        # a line can hold several steps or transitions, and each gets the comment
+        steps_by_line = {}
+        for step in self.steps:
+            steps_by_line.setdefault(step.line_number, []).append(step)
+        transitions_by_line = {}
         for trans in self.transitions:
-            if trans.line_number in self.file_comments:
-                trans.comment= self.file_comments[trans.line_number]     
+            transitions_by_line.setdefault(trans.line_number, []).append(trans)
+
+        for line_number, comment in self.file_comments.items():
+            for step in steps_by_line.get(line_number, ()):
+                step.comments.append(comment)
+
+            for trans in transitions_by_line.get(line_number, ()):
+                trans.comment = comment
 
     def _find_next_step_from(self, line_number: int):
         """Find the next step (S or SI) after given line number.
@@ -816,30 +908,73 @@ class Parser:
     def _validate(self):
         """Validate the parsed SFC."""
         # Check for initial step
-        if not any(step.is_initial for step in self.steps):
+        if not self.has_initial_step:
             self._record_error("No initial step (SI) found", None)
 
         # Check all transitions have from and to steps (or are connected via branches)
         for transition in self.transitions:
             # Transitions in branches or after branches don't need from_step
-            if transition.incoming_steps ==[]:
+            if not transition.incoming_steps:
                 self._record_error(
                     f"Transition {transition.name}  has no incoming step",
                     transition.line_number
                 )
             # Transitions in branches or before branches don't need to_step
-            if transition.outgoing_steps ==[]:
+            if not transition.outgoing_steps:
                 self._record_error(
                     f"Transition {transition.name} has no outgoing step",
                     transition.line_number
                 )
     # Token navigation helpers
 
+    def _index_token_positions(self):
+        """Build the token type array and per-TokenType position index.
+
+        Navigation helpers read token types from the flat _token_types
+        list; Token objects are only touched for values and line numbers.
+        """
+        token_types = [token.type for token in self.tokens]
+        positions = {}
+        for i, token_type in enumerate(token_types):
+            positions.setdefault(token_type, []).append(i)
+        self._token_types = token_types
+        self._positions_by_type = positions
+        eof_positions = positions.get(_TT_EOF)
+        self._eof_index = eof_positions[0] if eof_positions else len(token_types)
+
+    def _next_position(self, token_type: TokenType):
+        """Find the next token of a given type at or after the current one.
+
+        Args:
+            token_type: TokenType to search for
+
+        Returns:
+            Token index, or len(self.tokens) if there is none
+        """
+        positions = self._positions_by_type.get(token_type, ())
+        i = bisect_left(positions, self.current)
+        if i < len(positions):
+            return positions[i]
+        return len(self.tokens)
+
     def _current_token(self):
         """Return current token or None if at end."""
-        if self._at_end():
+        current = self.current
+        if current >= self._eof_index:
             return None
-        return self.tokens[self.current]
+        return self.tokens[current]
+
+    def _current_line(self, default: int):
+        """Return the current token's line number, or default if at end.
+
+        Args:
+            default: Line number to report when no token is left
+
+        Returns:
+            1-indexed line number
+        """
+        token = self._current_token()
+        return token.line_number if token else default
 
     def _peek_token(self, offset=1):
         """Look ahead at token without consuming.
@@ -857,15 +992,13 @@ class Parser:
 
     def _advance(self):
         """Move to next token."""
-        if not self._at_end():
-            self.current += 1
+        current = self.current
+        if current < self._eof_index:
+            self.current = current + 1
 
     def _at_end(self):
         """Check if at end of token stream."""
-        if self.current >= len(self.tokens):
-            return True
-        # Check if current token is EOF without calling _check (avoid recursion)
-        return self.tokens[self.current].type == TokenType.EOF
+        return self.current >= self._eof_index
 
     def _check(self, token_type: TokenType):
         """Check if current token matches type without consuming.
@@ -876,20 +1009,29 @@ class Parser:
         Returns:
             True if current token matches, False otherwise
         """
-        if self._at_end():
-            return False
-        return self._current_token().type == token_type
+        current = self.current
+        return current < self._eof_index and self._token_types[current] is token_type
     
-    def _consume(self,token_type:TokenType):
-        if not self._current_token().type == token_type:
+    def _consume(self, token_type: TokenType):
+        """Consume current token if it matches type and return its value.
+
+        Args:
+            token_type: Expected TokenType
+
+        Returns:
+            Token value, or None if the token does not match (error recorded)
+        """
+        current = self.current
+        token = self.tokens[current] if current < self._eof_index else None
+        if token is None or token.type is not token_type:
             self._record_error(
-                    f"Expected to consume {token_type.name}, got {current.type.name if current else 'EOF'}",
-                    current.line_number if current else self.tokens[-1].line_number
-                )    
-        consumed_token =self._current_token().value
-        self._advance()
+                f"Expected to consume {token_type.name}, got {token.type.name if token else 'EOF'}",
+                token.line_number if token else self.tokens[-1].line_number
+            )
+            return None
 
-        return consumed_token
+        self.current = current + 1
+        return token.value
     
     def _check_behind(self, token_type:TokenType):
         if self.current == 0:
@@ -903,23 +1045,43 @@ class Parser:
             token_type: Expected TokenType
 
         Returns:
-            True if matched, False if error (error recorded)
+            True if matched
+
+        Raises:
+            _RecoverBoundary: If the token does not match (error recorded)
         """
-        if not self._check(token_type):
-            current = self._current_token()
+        current = self._current_token()
+        if current is None or current.type is not token_type:
             self._record_error(
                 f"Expected {token_type.name}, got {current.type.name if current else 'EOF'}",
                 current.line_number if current else self.tokens[-1].line_number
             )
-            return False
+            raise _RecoverBoundary()
 
-        self._advance()
+        self.current += 1
         return True
 
+    def _synchronize(self):
+        """Skip the rest of a malformed statement.
+
+        Stops at the next newline or at any token that starts a statement
+        or delimits a branch, so leg separators and convergence operators
+        on the same line are still seen by the branch parser.
+        """
+        token_types = self._token_types
+        i = self.current
+        while token_types[i] not in _SYNC_TOKENS:
+            i += 1
+        self.current = i
+
     def _skip_newlines(self):
         """Skip any newline tokens."""
-        while self._check(TokenType.NEWLINE):
-            self._advance()
+        token_types = self._token_types
+        eof_index = self._eof_index
+        i = self.current
+        while i < eof_index and token_types[i] is _TT_NEWLINE:
+            i += 1
+        self.current = i
 
     def _record_error(self, message: str, line_number: int):
         """Record a parse error.
@@ -928,5 +1090,5 @@ class Parser:
             message: Error description
             line_number: Line number where error occurred
         """
-        error = ParseError(message, line_number)
-        self.errors.add(error)
+        self.errors.record(message, line_number)
+        self._dirty = True
@@ -3,8 +3,12 @@
 This module provides classes for representing Sequential Function Charts
 parsed from QuickSFC (.qsfc) files.
 """
+import heapq
+from operator import attrgetter
 from typing import List
 
+_line_number = attrgetter("line_number")
+
 
 class Step:
     """Represents a step in Quick SFC.
@@ -23,6 +27,11 @@ class Step:
         line_number: 1-indexed line number from .qsfc file (same as id)
     """
 
+    # One Step per S/SI line; slots avoid a per-instance __dict__
+    __slots__ = ('name', 'id', 'operand', 'action', 'preset', 'is_initial',
+                 'line_number', 'comments',
+                 '_incoming_transitions', '_outgoing_transitions')
+
     def __init__(self, name: str, action: str, preset: int = 0,
                  line_number: int = None, comments:List = None, is_initial: bool = False):
         self.name = name  # Mandatory identifier
@@ -34,9 +43,9 @@ class Step:
         self.line_number = line_number
         self.comments = comments
 
-        # Bidirectional relationships (private)
-        self._incoming_transitions = []
-        self._outgoing_transitions = []
+        # Bidirectional relationships (private), dicts used as ordered sets
+        self._incoming_transitions = {}
+        self._outgoing_transitions = {}
 
     @property
     def incoming_transitions(self):
@@ -55,7 +64,15 @@ class Step:
             transition: Transition object to add
         """
         if transition not in self._incoming_transitions:
-            self._incoming_transitions.append(transition)
+            self._incoming_transitions[transition] = None
+
+    def add_incoming_transitions(self, transitions):
+        """Add several incoming transitions at once (called by parser).
+
+        Args:
+            transitions: Iterable of Transition objects to add
+        """
+        self._incoming_transitions.update(dict.fromkeys(transitions))
 
     def add_outgoing_transition(self, transition):
         """Add an outgoing transition (called by parser).
@@ -64,7 +81,7 @@ class Step:
             transition: Transition object to add
         """
         if transition not in self._outgoing_transitions:
-            self._outgoing_transitions.append(transition)
+            self._outgoing_transitions[transition] = None
 
     def __repr__(self):
         initial = "SI" if self.is_initial else "S"
@@ -86,6 +103,10 @@ class Transition:
         line_number: 1-indexed line number from .qsfc file (same as id)
     """
 
+    # One Transition per T line; slots avoid a per-instance __dict__
+    __slots__ = ('name', 'id', 'operand', 'condition', 'target_name',
+                 'line_number', 'comment', '_incoming_steps', '_outgoing_steps')
+
     def __init__(self, name: str, condition: str, target_name: str = None,
                  line_number: int = None, comment:str =None):
         self.name = name  # Mandatory identifier
@@ -96,35 +117,37 @@ class Transition:
         self.line_number = line_number
         self.comment = comment
 
-        # Bidirectional relationships (private)
-        self._incoming_steps = []
-        self._outgoing_steps = []
+        # Bidirectional relationships (private), dicts used as ordered sets
+        self._incoming_steps = {}
+        self._outgoing_steps = {}
 
     @property
     def incoming_steps(self):
         """Return a list of incoming Step objects."""
-        return self._incoming_steps
+        return list(self._incoming_steps)
 
     @property
     def outgoing_steps(self):
         """Return a list of outgoing Step objects."""
-        return self._outgoing_steps
+        return list(self._outgoing_steps)
 
     def add_incoming_step(self, step):
-        """add step to incoming steps
+        """add step to incoming steps, ignoring duplicates
 
         Args:
             step: Step object
         """
-        self._incoming_steps.append(step)
+        if step not in self._incoming_steps:
+            self._incoming_steps[step] = None
 
     def add_outgoing_step(self, step):
-        """add step to outgoing steps
+        """add step to outgoing steps, ignoring duplicates
 
         Args:
             step: Step object
         """
-        self._outgoing_steps.append(step)
+        if step not in self._outgoing_steps:
+            self._outgoing_steps[step] = None
 
     def __repr__(self):
         target = f"->@{self.target_name}" if self.target_name else "->next"
@@ -144,6 +167,9 @@ class Branch():
         line_number: Line number where branch starts
     """
 
+    __slots__ = ('id', 'branch_type', 'flow_type', 'legs', 'name',
+                 'line_number', 'root')
+
     def __init__(self, branch_type: str, flow_type: str, line_number: int = None):
         self.id = None  # Global ID - assigned by parser
         self.branch_type = branch_type  # "DIVERGE" or "CONVERGE"
@@ -162,8 +188,9 @@ class Branch():
     @property
     def elements_in_branch(self):
         branch_elements = []
+        extend = branch_elements.extend
         for leg in self.legs:
-           branch_elements += leg.elements
+            extend(leg.elements)
         return branch_elements
 
         
@@ -184,24 +211,49 @@ class Leg:
         transitions: List of Transition objects in this leg
     """
 
+    __slots__ = ('id', 'steps', 'transitions', '_elements', '_sorted_elements')
+
     def __init__(self):
+        self.id = None  # Legs get no parser ID; set by callers that need one
         self.steps = []
         self.transitions = []
+        self._elements = None  # Cached by elements
+        self._sorted_elements = None  # Cached by elements_sorted_by_line_number
 
     @property
     def elements(self) -> List[Step|Branch]:
-        return self.steps + self.transitions
+        """Return the leg's steps followed by its transitions.
+
+        The result is cached until add_step() or add_transition() is called.
+        """
+        if self._elements is None:
+            self._elements = self.steps + self.transitions
+        return self._elements
 
     def elements_sorted_by_line_number(self):
-        return sorted(self.elements,key=lambda x: x.line_number)
+        """Return steps and transitions ordered by line number.
+
+        Steps and transitions are each added in source order, so the two
+        lists are merged rather than sorted. The result is cached until
+        add_step() or add_transition() is called.
+        """
+        if self._sorted_elements is None:
+            self._sorted_elements = list(
+                heapq.merge(self.steps, self.transitions, key=_line_number)
+            )
+        return self._sorted_elements
     
     def add_step(self, step):
         """Add a step to this leg."""
         self.steps.append(step)
+        self._elements = None
+        self._sorted_elements = None
 
     def add_transition(self, transition):
         """Add a transition to this leg."""
         self.transitions.append(transition)
+        self._elements = None
+        self._sorted_elements = None
     
 
     def __repr__(self):
@@ -230,16 +282,47 @@ class SFC:
         self._transitions_by_name = {trans.name: trans for trans in transitions}
         self._transitions_by_id = {trans.id: trans for trans in transitions}
         self._transitions_by_operand = {trans.operand: trans for trans in transitions}
-        self.branches = branches or []
+        # IDs are global across steps and transitions, so one map serves both
+        self._nodes_by_id = self._transitions_by_id | self._steps_by_id
+        self.branches = branches or []  # Also builds the get_branches() index
+
+    @property
+    def branches(self):
+        """Return the list of Branch objects.
+
+        Add branches with add_branch() or assign a new list, so that
+        get_branches() stays current.
+        """
+        return self._branches
+
+    @branches.setter
+    def branches(self, branches):
+        self._branches = branches
+        self._branches_by_kind = {}
+        for branch in branches:
+            self._index_branch(branch)
+
+    def add_branch(self, branch):
+        """Add a branch and index it for get_branches().
+
+        Args:
+            branch: Branch object to add
+        """
+        self._branches.append(branch)
+        self._index_branch(branch)
+
+    def _index_branch(self, branch):
+        self._branches_by_kind.setdefault(
+            (branch.branch_type, branch.flow_type), []).append(branch)
 
     @property
     def steps(self):
-        """Return list of all Step objects."""
+        """Return list of all Step objects, in parse (and so ID) order."""
         return list(self._steps_by_operand.values())
 
     @property
     def transitions(self):
-        """Return list of all Transition objects."""
+        """Return list of all Transition objects, in parse (and so ID) order."""
         return list(self._transitions_by_operand.values())
 
     @property
@@ -250,8 +333,16 @@ class SFC:
                 return step
         return None
     
-    def get_node_by_id(self,id:int) -> Step | Transition:
-        return self._transitions_by_id | self._steps_by_id
+    def get_node_by_id(self, id: int) -> Step | Transition:
+        """Get step or transition by global ID.
+
+        Args:
+            id: Global ID assigned by the parser
+
+        Returns:
+            Step or Transition object, or None if not found
+        """
+        return self._nodes_by_id.get(id)
 
     def get_step_by_name(self, name: str):
         """Get step by name.
@@ -332,27 +423,43 @@ class SFC:
         """
         return self.get_step(line_number)
 
+    def get_branches(self, branch_type: str, flow_type: str):
+        """Get branches of one kind, in parse order.
+
+        Args:
+            branch_type: "DIVERGE" or "CONVERGE"
+            flow_type: "AND" or "OR"
+
+        Returns:
+            New list of Branch objects (empty if none match)
+        """
+        return list(self._branches_by_kind.get((branch_type, flow_type), ()))
+
     def print_summary(self):
         """Print a human-readable summary of the SFC."""
         print("\n" + "=" * 70)
         print("QuickSFC SFC Summary")
         print("=" * 70 + "\n")
 
-        print(f"STEPS: {len(self.steps)}")
+        print(f"STEPS: {len(self._steps_by_operand)}")
         print("-" * 70)
         print(f"{'Name':<12} {'Type':<4} {'Action':<30} {'Preset':<10}")
         print("-" * 70)
-        for step in sorted(self.steps, key=lambda s: s.operand):
+        steps_by_operand = self._steps_by_operand
+        for operand in sorted(steps_by_operand):
+            step = steps_by_operand[operand]
             stype = "SI" if step.is_initial else "S"
             action_str = step.action[:27] + "..." if len(step.action) > 30 else step.action
             print(f"@{step.name:<11} {stype:<4} "
                   f"{action_str:<30} {step.preset}ms")
 
-        print(f"\nTRANSITIONS: {len(self.transitions)}")
+        print(f"\nTRANSITIONS: {len(self._transitions_by_operand)}")
         print("-" * 70)
         print(f"{'Name':<12} {'From':<12} {'To':<12} {'Condition':<20}")
         print("-" * 70)
-        for trans in sorted(self.transitions, key=lambda t: t.operand):
+        transitions_by_operand = self._transitions_by_operand
+        for operand in sorted(transitions_by_operand):
+            trans = transitions_by_operand[operand]
             from_name = f"@{trans.from_step.name}" if trans.from_step else "?"
             to_name = f"@{trans.to_step.name}" if trans.to_step else "?"
             cond_str = trans.condition[:17] + "..." if len(trans.condition) > 20 else trans.condition
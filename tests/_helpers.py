@@ -0,0 +1,26 @@
+"""Shared helpers for loading the .qsfc files used by the test suite."""
+
+import functools
+import os
+import sys
+
+# Add workspace to path for imports (same as run_tests.py)
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+QUICKSFC_DIR = os.path.dirname(TEST_DIR)
+WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
+if WORKSPACE_DIR not in sys.path:
+    sys.path.insert(0, WORKSPACE_DIR)
+
+from QuickSFC.parser import Parser
+
+
+@functools.lru_cache(maxsize=None)
+def read_qsfc(path):
+    """Read a .qsfc file, once per process."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def parse_qsfc(path):
+    """Parse a .qsfc file into a new SFC; only the file text is cached."""
+    return Parser(read_qsfc(path)).parse()
@@ -0,0 +1,42 @@
+"""Shared pytest fixtures for the QuickSFC test suite.
+
+Importing _helpers here puts the workspace on sys.path once, before any
+test module imports QuickSFC.
+"""
+
+import os
+
+import pytest
+
+from _helpers import TEST_DIR, parse_qsfc
+
+
+def _parse_test_file(filename):
+    """Parse a .qsfc file from the tests directory."""
+    return parse_qsfc(os.path.join(TEST_DIR, filename))
+
+
+# Parsed SFCs are shared across the whole session; tests only query them.
+
+@pytest.fixture(scope="session")
+def verbose(request):
+    """True when pytest runs with -v, for tests that print debug dumps."""
+    return request.config.getoption("verbose") > 0
+
+
+@pytest.fixture(scope="session")
+def simple_parallel_sfc():
+    """SFC parsed from simple_parallel.qsfc."""
+    return _parse_test_file('simple_parallel.qsfc')
+
+
+@pytest.fixture(scope="session")
+def simple_selection_sfc():
+    """SFC parsed from simple_selection.qsfc."""
+    return _parse_test_file('simple_selection.qsfc')
+
+
+@pytest.fixture(scope="session")
+def production_line_sfc():
+    """SFC parsed from production_line.qsfc."""
+    return _parse_test_file('production_line.qsfc')
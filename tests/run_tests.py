@@ -4,12 +4,7 @@
 import os
 import sys
 
-# Add parent directory to path for imports
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
-
+from _helpers import TEST_DIR, parse_qsfc  # Also puts the workspace on sys.path
 from QuickSFC.tokenizer import Tokenizer, TokenType, Token
 from QuickSFC.tokenizer import Tokenizer, TokenType
 from QuickSFC.sfc import Step, Transition, SFC, Branch, Leg
@@ -368,7 +363,7 @@ END"""
 
     # AND branches create DIVERGE and CONVERGE branches
     assert len(sfc.branches) >= 1
-    diverge = [b for b in sfc.branches if b.branch_type == "DIVERGE" and b.flow_type == "AND"][0]
+    diverge = sfc.get_branches("DIVERGE", "AND")[0]
 
     assert diverge.flow_type == "AND"
     assert len(diverge.legs) == 2
@@ -388,7 +383,7 @@ END"""
     sfc = parser.parse()
 
     assert len(sfc.branches) >= 1
-    diverge = [b for b in sfc.branches if b.flow_type == "OR"][0]
+    diverge = next(b for b in sfc.branches if b.flow_type == "OR")
     assert diverge.flow_type == "OR"
 
 
@@ -471,11 +466,7 @@ END"""
 def test_parse_with_existing_qsfc_file():
     """Integration test with existing simple_parallel.qsfc file."""
     test_file = os.path.join(TEST_DIR, 'simple_parallel.qsfc')
-    with open(test_file, 'r') as f:
-        content = f.read()
-
-    parser = Parser(content)
-    sfc = parser.parse()
+    sfc = parse_qsfc(test_file)
 
     assert len(sfc.steps) > 0
     assert len(sfc.transitions) > 0
@@ -490,16 +481,10 @@ def test_parse_with_existing_qsfc_file():
 def test_integration_simple_parallel():
     """Comprehensive integration test for simple_parallel.qsfc."""
     test_file = os.path.join(TEST_DIR, 'simple_parallel.qsfc')
-    with open(test_file, 'r') as f:
-        content = f.read()
-
-    parser = Parser(content)
-    sfc = parser.parse()
+    sfc = parse_qsfc(test_file)
 
     # Verify structure counts
-    assert len(sfc.steps) == 5
-    assert len(sfc.transitions) == 3
-    assert len(sfc.branches) == 2
+    assert (len(sfc.steps), len(sfc.transitions), len(sfc.branches)) == (5, 3, 2)
 
     # Verify initial step
     assert sfc.initial_step is not None
@@ -514,7 +499,7 @@ def test_integration_simple_parallel():
     finalize = sfc.get_transition_by_name("finalize")
 
     # Verify AND branch
-    diverge_and = [b for b in sfc.branches if b.branch_type == "DIVERGE" and b.flow_type == "AND"][0]
+    diverge_and = sfc.get_branches("DIVERGE", "AND")[0]
     assert len(diverge_and.legs) == 3
 
     # Verify parallel split
@@ -531,15 +516,10 @@ def test_integration_simple_parallel():
 def test_integration_simple_selection():
     """Comprehensive integration test for simple_selection.qsfc."""
     test_file = os.path.join(TEST_DIR, 'simple_selection.qsfc')
-    with open(test_file, 'r') as f:
-        content = f.read()
-
-    parser = Parser(content)
-    sfc = parser.parse()
+    sfc = parse_qsfc(test_file)
 
     # Verify structure counts
-    assert len(sfc.steps) == 7
-    assert len(sfc.transitions) == 9
+    assert (len(sfc.steps), len(sfc.transitions)) == (7, 9)
     assert len(sfc.branches) >= 1
 
     # Verify initial step
@@ -556,7 +536,7 @@ def test_integration_simple_selection():
     loop = sfc.get_transition_by_name("loop")
 
     # Verify OR branch
-    diverge_or = [b for b in sfc.branches if b.branch_type == "DIVERGE" and b.flow_type == "OR"][0]
+    diverge_or = sfc.get_branches("DIVERGE", "OR")[0]
     assert len(diverge_or.legs) == 3
 
     # Verify selection divergence
@@ -707,73 +687,44 @@ END
 # MAIN TEST RUNNER
 # =============================================================================
 
-def main():
-    """Run all tests and report results."""
-    print("=" * 70)
-    print("Running QuickSFC Unit Tests")
-    print("=" * 70)
+# Section for each test name prefix; anything else is a data model test
+SECTION_PREFIXES = (
+    ("test_tokenize_", "Tokenizer Tests"),
+    ("test_parse_", "Parser Tests"),
+    ("test_integration_", "Integration Tests"),
+    ("test_l5x_", "L5X Exporter Tests"),
+)
 
-    tokenizer_tests = [
-        ("test_tokenize_simple_step", test_tokenize_simple_step),
-        ("test_tokenize_multi_char_operators", test_tokenize_multi_char_operators),
-        ("test_tokenize_keywords_si_vs_s", test_tokenize_keywords_si_vs_s),
-        ("test_tokenize_with_comments", test_tokenize_with_comments),
-        ("test_tokenize_nested_parentheses_in_action", test_tokenize_nested_parentheses_in_action),
-        ("test_tokenize_action_vs_condition", test_tokenize_action_vs_condition),
-        ("test_tokenize_line_numbers", test_tokenize_line_numbers),
-        ("test_tokenize_invalid_character_raises_error", test_tokenize_invalid_character_raises_error),
-    ]
 
-    sfc_tests = [
-        ("test_step_creation", test_step_creation),
-        ("test_transition_creation", test_transition_creation),
-        ("test_step_transition_bidirectional_relationship", test_step_transition_bidirectional_relationship),
-        ("test_qgsfc_query_methods", test_qgsfc_query_methods),
-        ("test_qgsfc_initial_step_property", test_qgsfc_initial_step_property),
-        ("test_branch_and_leg_structure", test_branch_and_leg_structure),
-    ]
+def collect_tests():
+    """Collect the module's test_* functions by section, in definition order.
 
-    parser_tests = [
-        ("test_parse_minimal_sfc", test_parse_minimal_sfc),
-        ("test_parse_simple_sequence", test_parse_simple_sequence),
-        ("test_parse_jump_target", test_parse_jump_target),
-        ("test_parse_or_branch_with_convergence", test_parse_or_branch_with_convergence),
-        ("test_parse_and_branch_with_convergence", test_parse_and_branch_with_convergence),
-        ("test_parse_or_branch_without_convergence_all_jump", test_parse_or_branch_without_convergence_all_jump),
-        ("test_parse_assigns_ids_sequentially", test_parse_assigns_ids_sequentially),
-        ("test_parse_error_duplicate_step_name", test_parse_error_duplicate_step_name),
-        ("test_parse_error_missing_si", test_parse_error_missing_si),
-        ("test_parse_error_missing_end", test_parse_error_missing_end),
-        ("test_parse_error_invalid_jump_target", test_parse_error_invalid_jump_target),
-        ("test_parse_with_existing_qsfc_file", test_parse_with_existing_qsfc_file),
-    ]
+    The functions are plain pytest tests as well, so the same file can be run
+    with ``pytest tests/run_tests.py`` when pytest is available.
+    """
+    sections = {}
+    for name, obj in list(globals().items()):
+        if not (name.startswith("test_") and callable(obj)):
+            continue
+        section = next((title for prefix, title in SECTION_PREFIXES
+                        if name.startswith(prefix)), "SFC Data Model Tests")
+        sections.setdefault(section, []).append((name, obj))
+    return sections
 
-    integration_tests = [
-        ("test_integration_simple_parallel", test_integration_simple_parallel),
-        ("test_integration_simple_selection", test_integration_simple_selection),
-    ]
 
-    l5x_exporter_tests = [
-        ("test_l5x_export_simple_sfc", test_l5x_export_simple_sfc),
-        ("test_l5x_export_with_metadata", test_l5x_export_with_metadata),
-        ("test_l5x_export_to_file", test_l5x_export_to_file),
-        ("test_l5x_export_production_line", test_l5x_export_production_line),
-        ("test_l5x_export_creates_tags", test_l5x_export_creates_tags),
-    ]
+def main():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("Running QuickSFC Unit Tests")
+    print("=" * 70)
 
-    all_tests = [
-        ("\nTokenizer Tests (8)", tokenizer_tests),
-        ("\nSFC Data Model Tests (6)", sfc_tests),
-        ("\nParser Tests (12)", parser_tests),
-        ("\nIntegration Tests (2)", integration_tests),
-        ("\nL5X Exporter Tests (5)", l5x_exporter_tests),
-    ]
+    all_tests = collect_tests()
 
     total_passed = 0
     total_failed = 0
 
-    for section_name, tests in all_tests:
-        print(section_name)
+    for section_name, tests in all_tests.items():
+        print(f"\n{section_name} ({len(tests)})")
         print("-" * 70)
         section_passed = 0
         section_failed = 0
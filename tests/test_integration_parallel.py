@@ -3,38 +3,26 @@
 import os
 import sys
 
-# Add parent directory to path for imports
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
+from _helpers import TEST_DIR, parse_qsfc
 
-from QuickSFC.parser import Parser
 
-
-def test_parse_simple_parallel():
+def test_parse_simple_parallel(simple_parallel_sfc):
     """Verify that simple_parallel.qsfc is correctly parsed."""
-    test_file = os.path.join(TEST_DIR, 'simple_parallel.qsfc')
-    with open(test_file, 'r') as f:
-        content = f.read()
-
-    parser = Parser(content)
-    sfc = parser.parse()
+    sfc = simple_parallel_sfc
 
     # Verify structure counts
-    assert len(sfc.steps) == 5, f"Expected 5 steps, got {len(sfc.steps)}"
-    assert len(sfc.transitions) == 3, f"Expected 3 transitions, got {len(sfc.transitions)}"
-    assert len(sfc.branches) == 2, f"Expected 2 branches (DIVERGE AND + CONVERGE AND), got {len(sfc.branches)}"
+    # (steps, transitions, branches); the branches are DIVERGE AND + CONVERGE AND
+    counts = (len(sfc.steps), len(sfc.transitions), len(sfc.branches))
+    assert counts == (5, 3, 2), f"Expected (steps, transitions, branches) == (5, 3, 2), got {counts}"
 
     # Verify initial step
     assert sfc.initial_step is not None, "No initial step found"
     assert sfc.initial_step.name == "init", f"Initial step should be 'init', got '{sfc.initial_step.name}'"
 
     # Verify all expected steps exist
-    step_names = ["init", "do1", "do2", "do5", "do3"]
-    for name in step_names:
-        step = sfc.get_step_by_name(name)
-        assert step is not None, f"Step '@{name}' not found"
+    step_names = {"init", "do1", "do2", "do5", "do3"}
+    missing_steps = step_names - {step.name for step in sfc.steps}
+    assert not missing_steps, f"Steps not found: {sorted(missing_steps)}"
 
     init = sfc.get_step_by_name("init")
     do1 = sfc.get_step_by_name("do1")
@@ -43,21 +31,20 @@ def test_parse_simple_parallel():
     do3 = sfc.get_step_by_name("do3")
 
     # Verify all expected transitions exist
-    transition_names = ["beginsplit", "do2done", "finalize"]
-    for name in transition_names:
-        trans = sfc.get_transition_by_name(name)
-        assert trans is not None, f"Transition '@{name}' not found"
+    transition_names = {"beginsplit", "do2done", "finalize"}
+    missing_transitions = transition_names - {trans.name for trans in sfc.transitions}
+    assert not missing_transitions, f"Transitions not found: {sorted(missing_transitions)}"
 
     beginsplit = sfc.get_transition_by_name("beginsplit")
     do2done = sfc.get_transition_by_name("do2done")
     finalize = sfc.get_transition_by_name("finalize")
 
     # Verify AND branch structure
-    diverge_and = [b for b in sfc.branches if b.branch_type == "DIVERGE" and b.flow_type == "AND"]
+    diverge_and = sfc.get_branches("DIVERGE", "AND")
     assert len(diverge_and) == 1, f"Expected 1 DIVERGE AND branch, got {len(diverge_and)}"
     assert len(diverge_and[0].legs) == 3, f"Expected 3 parallel legs, got {len(diverge_and[0].legs)}"
 
-    converge_and = [b for b in sfc.branches if b.branch_type == "CONVERGE" and b.flow_type == "AND"]
+    converge_and = sfc.get_branches("CONVERGE", "AND")
     assert len(converge_and) == 1, f"Expected 1 CONVERGE AND branch, got {len(converge_and)}"
 
     # Verify jump target on finalize transition
@@ -86,7 +73,7 @@ def test_parse_simple_parallel():
 
 if __name__ == "__main__":
     try:
-        test_parse_simple_parallel()
+        test_parse_simple_parallel(parse_qsfc(os.path.join(TEST_DIR, 'simple_parallel.qsfc')))
         print("\n✓ Integration test PASSED: simple_parallel.qsfc is correctly parsed")
         sys.exit(0)
     except AssertionError as e:
@@ -3,27 +3,16 @@
 import os
 import sys
 
-# Add parent directory to path for imports
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
+from _helpers import TEST_DIR, parse_qsfc
 
-from QuickSFC.parser import Parser
 
-
-def test_parse_simple_selection():
+def test_parse_simple_selection(simple_selection_sfc):
     """Verify that simple_selection.qsfc is correctly parsed."""
-    test_file = os.path.join(TEST_DIR, 'simple_selection.qsfc')
-    with open(test_file, 'r') as f:
-        content = f.read()
-
-    parser = Parser(content)
-    sfc = parser.parse()
+    sfc = simple_selection_sfc
 
     # Verify structure counts
-    assert len(sfc.steps) == 7, f"Expected 7 steps, got {len(sfc.steps)}"
-    assert len(sfc.transitions) == 9, f"Expected 9 transitions, got {len(sfc.transitions)}"
+    counts = (len(sfc.steps), len(sfc.transitions))
+    assert counts == (7, 9), f"Expected (steps, transitions) == (7, 9), got {counts}"
     assert len(sfc.branches) >= 1, f"Expected at least 1 branch (DIVERGE OR), got {len(sfc.branches)}"
 
     # Verify initial step
@@ -31,10 +20,9 @@ def test_parse_simple_selection():
     assert sfc.initial_step.name == "init", f"Initial step should be 'init', got '{sfc.initial_step.name}'"
 
     # Verify all expected steps exist
-    step_names = ["init", "step1", "step2", "step3", "do2", "do3", "step4"]
-    for name in step_names:
-        step = sfc.get_step_by_name(name)
-        assert step is not None, f"Step '@{name}' not found"
+    step_names = {"init", "step1", "step2", "step3", "do2", "do3", "step4"}
+    missing_steps = step_names - {step.name for step in sfc.steps}
+    assert not missing_steps, f"Steps not found: {sorted(missing_steps)}"
 
     init = sfc.get_step_by_name("init")
     step1 = sfc.get_step_by_name("step1")
@@ -45,11 +33,10 @@ def test_parse_simple_selection():
     step4 = sfc.get_step_by_name("step4")
 
     # Verify all expected transitions exist
-    transition_names = ["initdone", "step1done", "step2done", "condition1",
-                       "condition2", "do2done", "condition3", "do3done", "loop"]
-    for name in transition_names:
-        trans = sfc.get_transition_by_name(name)
-        assert trans is not None, f"Transition '@{name}' not found"
+    transition_names = {"initdone", "step1done", "step2done", "condition1",
+                        "condition2", "do2done", "condition3", "do3done", "loop"}
+    missing_transitions = transition_names - {trans.name for trans in sfc.transitions}
+    assert not missing_transitions, f"Transitions not found: {sorted(missing_transitions)}"
 
     initdone = sfc.get_transition_by_name("initdone")
     step1done = sfc.get_transition_by_name("step1done")
@@ -62,7 +49,7 @@ def test_parse_simple_selection():
     loop = sfc.get_transition_by_name("loop")
 
     # Verify OR branch structure
-    diverge_or = [b for b in sfc.branches if b.branch_type == "DIVERGE" and b.flow_type == "OR"]
+    diverge_or = sfc.get_branches("DIVERGE", "OR")
     assert len(diverge_or) >= 1, f"Expected at least 1 DIVERGE OR branch, got {len(diverge_or)}"
     assert len(diverge_or[0].legs) == 3, f"Expected 3 alternative paths (legs), got {len(diverge_or[0].legs)}"
 
@@ -115,7 +102,7 @@ def test_parse_simple_selection():
 
 if __name__ == "__main__":
     try:
-        test_parse_simple_selection()
+        test_parse_simple_selection(parse_qsfc(os.path.join(TEST_DIR, 'simple_selection.qsfc')))
         print("\n✓ Integration test PASSED: simple_selection.qsfc is correctly parsed")
         sys.exit(0)
     except AssertionError as e:
@@ -1,20 +1,43 @@
 """Tests for L5X exporter."""
 
-import sys
 import os
 import xml.etree.ElementTree as ET
 import tempfile
 
-# Add workspace to path for imports (same as run_tests.py)
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
+import pytest
 
+from _helpers import TEST_DIR  # Also puts the workspace on sys.path
 from QuickSFC import parse_file, parse_string
 from QuickSFC.L5X_exporter import L5XExporter, L5XExportError
 
 
+def _export_root(sfc):
+    """Export an SFC to an L5X element tree."""
+    return L5XExporter(sfc).to_element()
+
+
+def _export_test_file(filename):
+    """Parse a bundled .qsfc file with parse_file() and export it."""
+    return _export_root(parse_file(os.path.join(TEST_DIR, filename)))
+
+
+# Exported documents for the bundled .qsfc files, built once per module
+
+@pytest.fixture(scope="module")
+def production_line_root():
+    return _export_test_file('production_line.qsfc')
+
+
+@pytest.fixture(scope="module")
+def simple_parallel_root():
+    return _export_test_file('simple_parallel.qsfc')
+
+
+@pytest.fixture(scope="module")
+def simple_selection_root():
+    return _export_test_file('simple_selection.qsfc')
+
+
 def test_export_simple_sfc():
     """Test exporting a simple SFC creates valid XML."""
     content = """SI@init(action:=1;)
@@ -42,6 +65,22 @@ END
     assert len(links) > 0
 
 
+def test_to_element_matches_to_string():
+    """Test that to_element() returns the tree that to_string() serializes."""
+    content = """SI@init(action:=1;)
+T@done(cond)
+S@final()
+T@loop() -> @init
+END
+"""
+    sfc = parse_string(content)
+
+    root = L5XExporter(sfc).to_element()
+    parsed = ET.fromstring(L5XExporter(sfc).to_string())
+
+    assert [(e.tag, e.attrib) for e in root.iter()] == [(e.tag, e.attrib) for e in parsed.iter()]
+
+
 def test_export_with_custom_metadata():
     """Test setting custom program/controller names."""
     content = """SI@init()
@@ -58,8 +97,7 @@ END
         .set_software_revision("33.00")
     )
 
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = exporter.to_element()
 
     assert root.get("TargetName") == "TestProgram"
     assert root.get("SoftwareRevision") == "33.00"
@@ -97,16 +135,9 @@ END
             os.unlink(filepath)
 
 
-def test_export_production_line():
+def test_export_production_line(production_line_root):
     """Test exporting the production_line.qsfc file."""
-    test_dir = os.path.dirname(os.path.abspath(__file__))
-    qsfc_file = os.path.join(test_dir, "production_line.qsfc")
-
-    sfc = parse_file(qsfc_file)
-    exporter = L5XExporter(sfc)
-
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = production_line_root
 
     # Verify expected elements
     steps = root.findall('.//Step')
@@ -118,16 +149,9 @@ def test_export_production_line():
     assert len(branches) == 4  # 2 diverge, 2 converge
 
 
-def test_export_parallel_branches():
+def test_export_parallel_branches(simple_parallel_root):
     """Test exporting SFC with parallel (AND) branches."""
-    test_dir = os.path.dirname(os.path.abspath(__file__))
-    qsfc_file = os.path.join(test_dir, "simple_parallel.qsfc")
-
-    sfc = parse_file(qsfc_file)
-    exporter = L5XExporter(sfc)
-
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = simple_parallel_root
 
     # Check branch types
     branches = root.findall('.//Branch')
@@ -136,16 +160,9 @@ def test_export_parallel_branches():
     assert len(simultaneous_branches) > 0
 
 
-def test_export_selection_branches():
+def test_export_selection_branches(simple_selection_root):
     """Test exporting SFC with selection (OR) branches."""
-    test_dir = os.path.dirname(os.path.abspath(__file__))
-    qsfc_file = os.path.join(test_dir, "simple_selection.qsfc")
-
-    sfc = parse_file(qsfc_file)
-    exporter = L5XExporter(sfc)
-
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = simple_selection_root
 
     # Check branch types
     branches = root.findall('.//Branch')
@@ -165,8 +182,7 @@ END
     sfc = parse_string(content)
     exporter = L5XExporter(sfc)
 
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = exporter.to_element()
 
     # Find steps and check descriptions
     steps = root.findall('.//Step')
@@ -187,8 +203,7 @@ END
     sfc = parse_string(content)
     exporter = L5XExporter(sfc)
 
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = exporter.to_element()
 
     # Find action body
     action_line = root.find('.//Step/Action/Body/STContent/Line')
@@ -207,8 +222,7 @@ END
     sfc = parse_string(content)
     exporter = L5XExporter(sfc)
 
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = exporter.to_element()
 
     # Find program-level tags
     tags = root.findall('.//Program/Tags/Tag')
@@ -233,8 +247,7 @@ END
     sfc = parse_string(content)
     exporter = L5XExporter(sfc)
 
-    xml_str = exporter.to_string()
-    root = ET.fromstring(xml_str)
+    root = exporter.to_element()
 
     links = root.findall('.//DirectedLink')
 
@@ -243,33 +256,4 @@ END
 
 
 if __name__ == "__main__":
-    tests = [
-        test_export_simple_sfc,
-        test_export_with_custom_metadata,
-        test_export_to_file,
-        test_export_production_line,
-        test_export_parallel_branches,
-        test_export_selection_branches,
-        test_step_description_contains_name,
-        test_action_contains_code,
-        test_tags_are_created,
-        test_directed_links_created,
-    ]
-
-    print("L5X Exporter Tests")
-    print("-" * 50)
-
-    passed = 0
-    failed = 0
-
-    for test in tests:
-        try:
-            test()
-            print(f"  PASS: {test.__name__}")
-            passed += 1
-        except Exception as e:
-            print(f"  FAIL: {test.__name__}: {e}")
-            failed += 1
-
-    print("-" * 50)
-    print(f"Results: {passed} passed, {failed} failed")
+    raise SystemExit(pytest.main([__file__]))
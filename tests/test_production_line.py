@@ -4,64 +4,88 @@
 import os
 import sys
 
-# Add parent directory to path for imports
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
-
+from _helpers import TEST_DIR, read_qsfc  # Also puts the workspace on sys.path
 from QuickSFC.parser import Parser
 
-def test_selection_branch():
+# Row templates for the dump, built once rather than per row
+_STEP_ROW = "@{:<14} {:<5} {:<8} {:<20} {:<20} {:<30} {} \n".format
+_TRANSITION_ROW = "@{:<14} {:<5} {:<8} {:<15} {:<20} {:<30}{:<30}\n".format
+_BRANCH_ROW = "{:<12} {:<5} {:<16} {:<5}\n".format
+_LEG_ROW = "    Leg {}, contains {} steps, {} transitions\n".format
 
-    test_file = os.path.join(TEST_DIR, 'production_line.qsfc')
-    with open(test_file, 'r') as f:
-        content = f.read()
+def test_selection_branch(verbose):
+    """Parse production_line.qsfc and dump the parse results.
 
-    print(f"\nInput file:\n{content}\n")
+    The dump is only built and printed when pytest runs with -v.
+    """
+    content = read_qsfc(os.path.join(TEST_DIR, 'production_line.qsfc'))
 
     parser = Parser(content)
     sfc = parser.parse()
+    assert sfc.initial_step is not None
+
+    if verbose:
+        lines = [f"\nInput file:\n{content}\n\n"]
 
-    print(f"\n{'='*70}")
-    print("Parse Results:")
-    print(f"{'='*70}\n")
+        lines.append(f"\n{'='*70}\n")
+        lines.append("Parse Results:\n")
+        lines.append(f"{'='*70}\n\n")
 
-    # Print file_comments dictionary
-    print(f"FILE_COMMENTS ({len(parser.file_comments)}):")
-    print("-"*70)
-    for line_num, comment in sorted(parser.file_comments.items()):
-        print(f"Line {line_num}: {comment}")
-    print()
+        # Print file_comments dictionary
+        lines.append(f"FILE_COMMENTS ({len(parser.file_comments)}):\n")
+        lines.append("-"*70 + "\n")
+        lines.extend(
+            f"Line {line_num}: {comment}\n"
+            for line_num, comment in sorted(parser.file_comments.items())
+        )
+        lines.append("\n")
 
-    # Print all steps with IDs and coordinates
-    print(f"STEPS ({len(sfc.steps)}):")
-    print("-"*70)
-    print(f"{'Name':<15} {'ID':<5} {'Operand':<8} {'Incoming Transitions':<20} {'Outgoing Transitions':<20} {'Comments':<20}{'Action'}")
-    print("-"*70)
-    for step in sorted(sfc.steps, key=lambda s: s.id):
-        print(f"@{step.name:<14} {step.id:<5} {step.operand:<8} {str(list(map(lambda t:t.name,step.incoming_transitions))):<20} {str(list(map(lambda t:t.name,step.outgoing_transitions))):<20} {str(step.comments):<30} {str(step.action)} ")
+        # Print all steps with IDs and coordinates
+        lines.append(f"STEPS ({len(sfc.steps)}):\n")
+        lines.append("-"*70 + "\n")
+        lines.append(f"{'Name':<15} {'ID':<5} {'Operand':<8} {'Incoming Transitions':<20} {'Outgoing Transitions':<20} {'Comments':<20}{'Action'}\n")
+        lines.append("-"*70 + "\n")
+        lines.extend(
+            _STEP_ROW(
+                step.name, step.id, step.operand,
+                str([t.name for t in step.incoming_transitions]),
+                str([t.name for t in step.outgoing_transitions]),
+                str(step.comments), str(step.action),
+            )
+            for step in sfc.steps
+        )
 
-    # Print all transitions with IDs and coordinates
-    print(f"\nTRANSITIONS ({len(sfc.transitions)}):")
-    print("-"*70)
-    print(f"{'Name':<15} {'ID':<5} {'Operand':<8} {'Target':<15} {'Incoming Steps':<20} {'Outgoing Steps':<30}{'Comments':<20} ")
-    print("-"*70)
-    for trans in sorted(sfc.transitions, key=lambda t: t.id):
-        target = f"@{trans.target_name}" if trans.target_name else ""
-        print(f"@{trans.name:<14} {trans.id:<5} {trans.operand:<8} {target:<15} {str(list(map(lambda s:s.name,trans.incoming_steps))):<20} {str(list(map(lambda s:s.name,trans.outgoing_steps))):<{30}}{str(trans.comment):<30}")
+        # Print all transitions with IDs and coordinates
+        lines.append(f"\nTRANSITIONS ({len(sfc.transitions)}):\n")
+        lines.append("-"*70 + "\n")
+        lines.append(f"{'Name':<15} {'ID':<5} {'Operand':<8} {'Target':<15} {'Incoming Steps':<20} {'Outgoing Steps':<30}{'Comments':<20} \n")
+        lines.append("-"*70 + "\n")
+        lines.extend(
+            _TRANSITION_ROW(
+                trans.name, trans.id, trans.operand,
+                f'@{trans.target_name}' if trans.target_name else '',
+                str([s.name for s in trans.incoming_steps]),
+                str([s.name for s in trans.outgoing_steps]),
+                str(trans.comment),
+            )
+            for trans in sfc.transitions
+        )
 
-    # Print all branches with IDs and L5X properties
-    print(f"\nBRANCHES ({len(sfc.branches)}):")
-    print("-"*70)
-    print(f"{'Type':<12}  {'ID':<5} {'FlowType':<16}  {'Legs':<5}")
-    print("-"*70)
-    for branch in sfc.branches:
-        print(f"{branch.flow_type:<12} {branch.id:<5} {branch.branch_type:<16} {len(list(branch.legs)):<5}")
-        for i, leg in enumerate(branch.legs):
+        # Print all branches with IDs and L5X properties
+        lines.append(f"\nBRANCHES ({len(sfc.branches)}):\n")
+        lines.append("-"*70 + "\n")
+        lines.append(f"{'Type':<12}  {'ID':<5} {'FlowType':<16}  {'Legs':<5}\n")
+        lines.append("-"*70 + "\n")
+        for branch in sfc.branches:
+            legs = branch.legs
+            lines.append(_BRANCH_ROW(branch.flow_type, branch.id, branch.branch_type, len(legs)))
+            lines.extend(
+                _LEG_ROW(i, len(leg.steps), len(leg.transitions))
+                for i, leg in enumerate(legs)
+            )
 
-            print(f"    Leg {i}, contains {len(leg.steps)} steps, {len(leg.transitions)} transitions")
+        sys.stdout.writelines(lines)
 
 
 if __name__ == "__main__":
-    test_selection_branch()
+    test_selection_branch(verbose=True)
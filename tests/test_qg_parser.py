@@ -1,15 +1,7 @@
 """Unit tests for qg_parser.py"""
 
-import os
-import sys
 import pytest
 
-# Add parent directory to path for imports
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
-
 from QuickSFC.parser import Parser
 from QuickSFC.errors import ParseError
 
@@ -90,8 +82,8 @@ END"""
         sfc = parser.parse()
 
         assert len(sfc.branches) == 2  # diverge + converge
-        diverge = [b for b in sfc.branches if b.branch_type == "DIVERGE"][0]
-        converge = [b for b in sfc.branches if b.branch_type == "CONVERGE"][0]
+        diverge = next(b for b in sfc.branches if b.branch_type == "DIVERGE")
+        converge = next(b for b in sfc.branches if b.branch_type == "CONVERGE")
 
         assert diverge.flow_type == "OR"
         assert len(diverge.legs) == 2
@@ -111,8 +103,8 @@ END"""
         sfc = parser.parse()
 
         assert len(sfc.branches) == 2
-        diverge = [b for b in sfc.branches if b.branch_type == "DIVERGE"][0]
-        converge = [b for b in sfc.branches if b.branch_type == "CONVERGE"][0]
+        diverge = next(b for b in sfc.branches if b.branch_type == "DIVERGE")
+        converge = next(b for b in sfc.branches if b.branch_type == "CONVERGE")
 
         assert diverge.flow_type == "AND"
         assert len(diverge.legs) == 2
@@ -209,18 +201,47 @@ END"""
 
         assert "not found" in str(exc_info.value)
 
+    def test_parse_error_malformed_step_before_leg_separator(self):
+        """Test that a malformed step in an AND leg stops at the | separator."""
+        content = """SI@init()
+T@split()
+//\\\\
+    S@leg1() S|
+    S@leg2()
+\\\\// T@join()
+END"""
+        parser = Parser(content)
+
+        with pytest.raises(ParseError) as exc_info:
+            parser.parse()
+
+        assert "Expected AT, got LEG_SEPARATOR" in str(exc_info.value)
+
+    def test_parse_error_malformed_first_transition_in_or_leg(self):
+        """Test that an OR leg left without transitions is reported, not linked."""
+        content = """SI@init()
+T@decide()
+S@choice()
+/\\
+    T@t4(s.DN) -> S@s5T()
+    |
+    T@opt2() -> S@step2()
+\\/ S@merge()
+END"""
+        parser = Parser(content)
+
+        with pytest.raises(ParseError) as exc_info:
+            parser.parse()
+
+        assert "must start with a transition" in str(exc_info.value)
+
 
 class TestParserIntegration:
     """Integration tests with existing .qsfc files."""
 
-    def test_parse_with_existing_qsfc_file(self):
+    def test_parse_with_existing_qsfc_file(self, simple_parallel_sfc):
         """Integration test with existing simple_parallel.qsfc file."""
-        test_file = os.path.join(TEST_DIR, 'simple_parallel.qsfc')
-        with open(test_file, 'r') as f:
-            content = f.read()
-
-        parser = Parser(content)
-        sfc = parser.parse()
+        sfc = simple_parallel_sfc
 
         # Basic sanity checks
         assert len(sfc.steps) > 0
@@ -1,15 +1,7 @@
 """Unit tests for qg_sfc.py"""
 
-import os
-import sys
 import pytest
 
-# Add parent directory to path for imports
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
-
 from QuickSFC.sfc import Step, Transition, SFC, Branch, Leg
 
 
@@ -59,6 +51,24 @@ class TestDataModelRelationships:
         assert step2 in trans.outgoing_steps
         assert trans in step2.incoming_transitions
 
+    def test_relationships_ignore_duplicates(self):
+        """Test that linking the same pair twice keeps a single entry."""
+        step1 = Step("step1", "action1")
+        trans = Transition("trans", "condition")
+        step2 = Step("step2", "action2")
+
+        for _ in range(2):
+            step1.add_outgoing_transition(trans)
+            trans.add_incoming_step(step1)
+            trans.add_outgoing_step(step2)
+            step2.add_incoming_transition(trans)
+        step2.add_incoming_transitions([trans, trans])
+
+        assert step1.outgoing_transitions == [trans]
+        assert trans.incoming_steps == [step1]
+        assert trans.outgoing_steps == [step2]
+        assert step2.incoming_transitions == [trans]
+
     def test_qgsfc_query_methods(self):
         """Test SFC query methods (by name, id, operand)."""
         step1 = Step("init", "x:=0", is_initial=True)
@@ -85,6 +95,12 @@ class TestDataModelRelationships:
         assert sfc.get_step(2) == step2
         assert sfc.get_transition(1) == trans
 
+        # Test query by id across steps and transitions
+        assert sfc.get_node_by_id(0) == step1
+        assert sfc.get_node_by_id(1) == trans
+        assert sfc.get_node_by_id(id=1) == trans
+        assert sfc.get_node_by_id(3) is None
+
         # Test query by operand
         assert sfc.get_step_by_operand(0) == step1
         assert sfc.get_step_by_operand(1) == step2
@@ -101,6 +117,27 @@ class TestDataModelRelationships:
 
         assert sfc.initial_step == step1
 
+    def test_qgsfc_get_branches(self):
+        """Test SFC can look up branches by branch and flow type."""
+        diverge = Branch("DIVERGE", "AND", line_number=2)
+        converge = Branch("CONVERGE", "AND", line_number=6)
+
+        sfc = SFC([], [], [diverge, converge])
+
+        assert sfc.get_branches("DIVERGE", "AND") == [diverge]
+        assert sfc.get_branches("CONVERGE", "AND") == [converge]
+        assert sfc.get_branches("DIVERGE", "OR") == []
+
+        # The index follows add_branch() and reassignment, and callers get copies
+        diverge_or = Branch("DIVERGE", "OR", line_number=8)
+        sfc.add_branch(diverge_or)
+        assert sfc.get_branches("DIVERGE", "OR") == [diverge_or]
+        sfc.get_branches("DIVERGE", "OR").clear()
+        assert sfc.get_branches("DIVERGE", "OR") == [diverge_or]
+        sfc.branches = [converge]
+        assert sfc.get_branches("DIVERGE", "AND") == []
+        assert sfc.get_branches("CONVERGE", "AND") == [converge]
+
     def test_branch_and_leg_structure(self):
         """Test QGBranch and QGLeg structure."""
         branch = Branch("DIVERGE", "OR", line_number=5)
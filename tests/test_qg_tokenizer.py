@@ -1,15 +1,7 @@
 """Unit tests for qg_tokenizer.py"""
 
-import os
-import sys
 import pytest
 
-# Add parent directory to path for imports
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-QUICKSFC_DIR = os.path.dirname(TEST_DIR)
-WORKSPACE_DIR = os.path.dirname(QUICKSFC_DIR)
-sys.path.insert(0, WORKSPACE_DIR)
-
 from QuickSFC.tokenizer import Tokenizer, TokenType, Token
 from QuickSFC.errors import TokenizeError
 
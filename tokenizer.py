@@ -4,9 +4,24 @@ This module provides lexical analysis for QuickSFC (.qsfc) files,
 converting text into a stream of tokens for the parser.
 """
 
+import re
+import string
+import sys
 from enum import Enum, auto
 from .errors import TokenizeError
 
+# Run of spaces, tabs and carriage returns (newlines are tokens)
+_INLINE_WHITESPACE = re.compile(r'[ \t\r]*')
+
+# Identifier characters that can be answered by one set lookup
+_ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+# Rest of a name: \w is str.isalnum() plus underscore, as in _is_alphanumeric
+_NAME_TAIL = re.compile(r'\w*')
+
+# Run of ASCII digits; other str.isdigit() characters are matched one by one
+_ASCII_DIGITS = re.compile(r'[0-9]*')
+
 
 class TokenType(Enum):
     """Token types for Quick SFC language."""
@@ -43,6 +58,40 @@ class TokenType(Enum):
     EOF = auto()
 
 
+# TokenType members bound at module level for the tokenizer hot path
+_TT_SI = TokenType.SI
+_TT_S = TokenType.S
+_TT_T = TokenType.T
+_TT_END = TokenType.END
+_TT_LPAREN = TokenType.LPAREN
+_TT_RPAREN = TokenType.RPAREN
+_TT_COMMA = TokenType.COMMA
+_TT_ACTION = TokenType.ACTION
+_TT_CONDITION = TokenType.CONDITION
+_TT_NUMBER = TokenType.NUMBER
+_TT_NAME = TokenType.NAME
+_TT_COMMENT = TokenType.COMMENT
+_TT_AT = TokenType.AT
+_TT_JUMP = TokenType.JUMP
+_TT_LEG_SEPARATOR = TokenType.LEG_SEPARATOR
+_TT_OR_DIVERGE = TokenType.OR_DIVERGE
+_TT_OR_CONVERGE = TokenType.OR_CONVERGE
+_TT_AND_DIVERGE = TokenType.AND_DIVERGE
+_TT_AND_CONVERGE = TokenType.AND_CONVERGE
+_TT_HASH = TokenType.HASH
+_TT_NEWLINE = TokenType.NEWLINE
+_TT_EOF = TokenType.EOF
+
+# Operators keyed by first character, longest first so //\\ wins over /\
+_OPERATORS_BY_FIRST_CHAR = {
+    '/': (("//\\\\", _TT_AND_DIVERGE), ("/\\", _TT_OR_DIVERGE)),
+    '\\': (("\\\\//", _TT_AND_CONVERGE), ("\\/", _TT_OR_CONVERGE)),
+    '>': ((">>", _TT_JUMP),),
+    '-': (("->", _TT_JUMP),),
+    '|': (("|", _TT_LEG_SEPARATOR),),
+}
+
+
 class Token:
     """Represents a single token in the QuickSFC language.
 
@@ -52,6 +101,9 @@ class Token:
         line_number: 1-indexed line number where token appears
     """
 
+    # One Token per lexeme; slots avoid a per-instance __dict__
+    __slots__ = ('type', 'value', 'line_number')
+
     def __init__(self, type_: TokenType, value, line_number: int):
         self.type = type_
         self.value = value
@@ -75,9 +127,13 @@ class Tokenizer:
             content: Full text content of .qsfc file
         """
         self.content = content
+        self.length = len(content)  # Content is never modified, so its length is fixed
         self.pos = 0
         self.line_number = 1
         self.tokens = []
+        self._append_token = self.tokens.append  # Bound once for _emit_token
+        self.state = 'NORMAL'  # Context for capturing actions/conditions
+        self.last_keyword_type = None  # Type of the most recent S, SI or T token
 
     def tokenize(self):
         """Tokenize the entire content and return list of tokens.
@@ -88,97 +144,156 @@ class Tokenizer:
         Raises:
             TokenizeError: If invalid characters or syntax encountered
         """
-        state = 'NORMAL'  # States: NORMAL, AFTER_NAME, AFTER_LPAREN
+        self.state = 'NORMAL'  # States: NORMAL, AFTER_KEYWORD, AFTER_NAME
 
-        while self.pos < len(self.content):
-            self._skip_whitespace_except_newline()
+        content = self.content
+        length = self.length
+        skip_whitespace = _INLINE_WHITESPACE.match
+        while self.pos < length:
+            # Same as _skip_whitespace_except_newline(), without the method call
+            pos = self.pos = skip_whitespace(content, self.pos).end()
 
-            if self._at_end():
+            if pos >= length:
                 break
 
-            # Handle comments (# to end of line)
-            if self._current_char() == '#':
-                self._handle_comment()
-                continue
-
-            # Handle newlines (significant for line tracking)
-            if self._current_char() == '\n':
-                self._emit_token(TokenType.NEWLINE, '\n')
-                self.line_number += 1
-                self.pos += 1
-                continue
-
-            # Try to match multi-character operators first (before single chars)
-            if self._match_multi_char_operators():
-                continue
-
-            # Try to match keywords (SI, S, T, END)
-            if self._match_keyword_with_state():
-                state = 'AFTER_KEYWORD'
-                continue
-
-            # Handle @ symbol (name prefix)
-            if self._current_char() == '@':
-                self._emit_token(TokenType.AT, '@')
-                self._advance()
-                # Expect NAME after @
-                if not self._match_name():
-                    raise TokenizeError(
-                        f"Expected identifier after '@'",
-                        self.line_number
-                    )
-                state = 'AFTER_NAME'
-                continue
-
-            # Handle left paren - capture action/condition
-            if self._current_char() == '(':
-                self._emit_token(TokenType.LPAREN, '(')
-                self._advance()
-
-                # After @name(, capture action or condition
-                if state == 'AFTER_NAME':
-                    # Peek at previous tokens to determine if S/SI or T
-                    content = self._capture_until([',', ')'])
-                    # Check token before @ to determine type
-                    keyword_token = self._find_recent_keyword()
-                    if keyword_token and keyword_token.type in [TokenType.S, TokenType.SI]:
-                        #check for an action or comment
-                        if ';' in content:
-                            self._emit_token(TokenType.ACTION, content)
-                        elif content.strip()!="":
-                            self._emit_token(TokenType.COMMENT, content)
-                    elif keyword_token and keyword_token.type == TokenType.T:
-                        self._emit_token(TokenType.CONDITION, content)
-                    else:
-                        # Default to action
-                        self._emit_token(TokenType.ACTION, content)
-                    state = 'NORMAL'
-                continue
-
-            # Try to match other delimiters
-            if self._match_delimiter_except_lparen():
-                continue
-
-            # Try to match numbers
-            if self._match_number():
-                continue
-
-            # Try to match standalone name (shouldn't happen in valid syntax)
-            if self._match_name():
-                continue
-
-            # Otherwise, it's an error
+            # One dict lookup picks the handler for the current character
+            _DISPATCH.get(content[pos], Tokenizer._handle_other)(self)
+
+        self._emit_token(_TT_EOF, None)
+        return self.tokens
+
+    def _handle_newline(self):
+        """Emit a NEWLINE token (significant for line tracking)."""
+        self._emit_token(_TT_NEWLINE, '\n')
+        self.line_number += 1
+        self.pos += 1
+
+    def _handle_operator(self):
+        """Match a multi-character operator or the leg separator."""
+        if not self._match_multi_char_operators():
+            self._raise_unexpected_character()
+
+    def _handle_s(self):
+        """Match SI or S keyword, or a name starting with S."""
+        pos = self.pos
+        # Check for SI first (must come before S)
+        if self.content.startswith("SI", pos) and self._ends_keyword(pos + 2):
+            self._emit_token(_TT_SI, "SI")
+            self.last_keyword_type = _TT_SI
+            self.pos = pos + 2
+            self.state = 'AFTER_KEYWORD'
+        elif self._ends_keyword(pos + 1):
+            self._emit_token(_TT_S, "S")
+            self.last_keyword_type = _TT_S
+            self.pos = pos + 1
+            self.state = 'AFTER_KEYWORD'
+        else:
+            # Standalone name (shouldn't happen in valid syntax)
+            self._match_name()
+
+    def _handle_t(self):
+        """Match T keyword, or a name starting with T."""
+        if self._ends_keyword(self.pos + 1):
+            self._emit_token(_TT_T, "T")
+            self.last_keyword_type = _TT_T
+            self.pos += 1
+            self.state = 'AFTER_KEYWORD'
+        else:
+            # Standalone name (shouldn't happen in valid syntax)
+            self._match_name()
+
+    def _handle_e(self):
+        """Match END keyword, or a name starting with E."""
+        pos = self.pos
+        if self.content.startswith("END", pos) and self._ends_keyword(pos + 3):
+            self._emit_token(_TT_END, "END")
+            self.pos = pos + 3
+            self.state = 'AFTER_KEYWORD'
+        else:
+            # Standalone name (shouldn't happen in valid syntax)
+            self._match_name()
+
+    def _ends_keyword(self, end_pos):
+        """Check that a keyword ending at end_pos is not part of a longer identifier.
+
+        Args:
+            end_pos: Position just past the keyword
+
+        Returns:
+            True if end_pos is at end of content or not alphanumeric
+        """
+        if end_pos >= self.length:
+            return True
+        char = self.content[end_pos]
+        return char not in _ASCII_WORD_CHARS and not char.isalnum()
+
+    def _handle_at(self):
+        """Match @ followed by the identifier it names, and the ( after it."""
+        self._emit_token(_TT_AT, '@')
+        self.pos += 1
+        # Expect NAME after @
+        if not self._match_name():
             raise TokenizeError(
-                f"Unexpected character: '{self._current_char()}'",
+                f"Expected identifier after '@'",
                 self.line_number
             )
+        self.state = 'AFTER_NAME'
 
-        self._emit_token(TokenType.EOF, None)
-        return self.tokens
+        # @name is almost always followed by its (ACTION/CONDITION); take it here
+        # rather than going back through the main loop and dispatch table
+        self._skip_whitespace_except_newline()
+        if self.pos < self.length and self.content[self.pos] == '(':
+            self._handle_lparen()
+
+    def _handle_lparen(self):
+        """Match a left paren and capture the action/condition after @name(."""
+        self._emit_token(_TT_LPAREN, '(')
+        self.pos += 1
+
+        # After @name(, capture action or condition
+        if self.state == 'AFTER_NAME':
+            content = self._capture_until([',', ')'])
+            # The keyword before @ determines the type
+            keyword_type = self.last_keyword_type
+            if keyword_type is _TT_S or keyword_type is _TT_SI:
+                #check for an action or comment
+                if ';' in content:
+                    self._emit_token(_TT_ACTION, content)
+                elif content.strip()!="":
+                    self._emit_token(_TT_COMMENT, content)
+            elif keyword_type is _TT_T:
+                self._emit_token(_TT_CONDITION, content)
+            else:
+                # Default to action
+                self._emit_token(_TT_ACTION, content)
+            self.state = 'NORMAL'
+
+    def _handle_other(self):
+        """Match a number or name outside the ASCII dispatch table, else fail."""
+        # Every valid ASCII lexeme start is a _DISPATCH key, so an ASCII
+        # character that lands here is invalid without trying the matchers
+        if self.content[self.pos].isascii():
+            self._raise_unexpected_character()
+
+        if self._match_number():
+            return
+
+        # Try to match standalone name (shouldn't happen in valid syntax)
+        if self._match_name():
+            return
+
+        self._raise_unexpected_character()
+
+    def _raise_unexpected_character(self):
+        """Raise TokenizeError for the current character."""
+        raise TokenizeError(
+            f"Unexpected character: '{self._current_char()}'",
+            self.line_number
+        )
 
     def _at_end(self):
         """Check if at end of content."""
-        return self.pos >= len(self.content)
+        return self.pos >= self.length
 
     def _current_char(self):
         """Return current character or None if at end."""
@@ -196,7 +311,7 @@ class Tokenizer:
             Character at offset position or None if out of bounds
         """
         peek_pos = self.pos + offset
-        if peek_pos >= len(self.content):
+        if peek_pos >= self.length:
             return None
         return self.content[peek_pos]
 
@@ -211,60 +326,45 @@ class Tokenizer:
             token_type: TokenType enum value
             value: Token value
         """
-        token = Token(token_type, value, self.line_number)
-        self.tokens.append(token)
+        self._append_token(Token(token_type, value, self.line_number))
 
     def _skip_whitespace_except_newline(self):
         """Skip spaces and tabs but not newlines."""
-        while not self._at_end() and self._current_char() in ' \t\r':
-            self._advance()
+        self.pos = _INLINE_WHITESPACE.match(self.content, self.pos).end()
 
     def _handle_comment(self):
-        self._emit_token(TokenType.HASH,'#')
-        self._advance()
-        comment = []
+        self._emit_token(_TT_HASH,'#')
+        self.pos += 1
         # capture until newline or end of file
-        while not self._at_end() and self._current_char() != '\n':
-            comment.append(self._current_char())
-            self._advance()
-        full_comment = ''.join(comment)
-        self._emit_token(TokenType.COMMENT,full_comment)    
-        self._advance
+        end = self.content.find('\n', self.pos)
+        if end == -1:
+            end = self.length
+        full_comment = self.content[self.pos:end]
+        self.pos = end
+        self._emit_token(_TT_COMMENT,full_comment)
         
     def _skip_comment(self):
         """Skip from # to end of line."""
         # Skip the # character
-        self._advance()
+        self.pos += 1
         # Skip until newline or end of file
-        while not self._at_end() and self._current_char() != '\n':
-            self._advance()
-    def _find_recent_keyword(self):
-        """Find the most recent S, SI, or T keyword token.
-
-        Returns:
-            Token object or None
-        """
-        for i in range(len(self.tokens) - 1, -1, -1):
-            token = self.tokens[i]
-            if token.type in [TokenType.S, TokenType.SI, TokenType.T]:
-                return token
-        return None
-
+        end = self.content.find('\n', self.pos)
+        self.pos = end if end != -1 else self.length
     def _match_name(self):
         """Try to match an identifier name (alphanumeric + underscore).
 
         Returns:
             True if name matched, False otherwise
         """
-        if not (self._current_char() and self._current_char().isalpha()):
+        start_pos = self.pos
+        if start_pos >= self.length or not self.content[start_pos].isalpha():
             return False
 
-        start_pos = self.pos
-        while not self._at_end() and self._is_alphanumeric(self._current_char()):
-            self._advance()
+        self.pos = _NAME_TAIL.match(self.content, start_pos).end()
 
-        name_str = self.content[start_pos:self.pos]
-        self._emit_token(TokenType.NAME, name_str)
+        # Names repeat across definitions and jump targets; share one object each
+        name_str = sys.intern(self.content[start_pos:self.pos])
+        self._emit_token(_TT_NAME, name_str)
         return True
 
     def _match_multi_char_operators(self):
@@ -273,112 +373,16 @@ class Tokenizer:
         Returns:
             True if operator matched, False otherwise
         """
-        # Check for AND divergence: //\\
-        if self._match_text_exact("//\\\\"):
-            self._emit_token(TokenType.AND_DIVERGE, "//\\\\")
-            return True
-
-        # Check for AND convergence: \\//
-        if self._match_text_exact("\\\\//"):
-            self._emit_token(TokenType.AND_CONVERGE, "\\\\//")
-            return True
-
-        # Check for jump operator: >>
-        if self._match_text_exact(">>"):
-            self._emit_token(TokenType.JUMP, ">>")
-            return True
-
-        # Check for arrow operator: ->
-        if self._match_text_exact("->"):
-            self._emit_token(TokenType.JUMP, "->")
-            return True
-
-        # Check for OR divergence: /\
-        if self._match_text_exact("/\\"):
-            self._emit_token(TokenType.OR_DIVERGE, "/\\")
-            return True
-
-        # Check for OR convergence: \/
-        if self._match_text_exact("\\/"):
-            self._emit_token(TokenType.OR_CONVERGE, "\\/")
-            return True
-
-        # Check for leg separator: |
-        if self._current_char() == '|':
-            self._emit_token(TokenType.LEG_SEPARATOR, '|')
-            self._advance()
-            return True
-
-        return False
-
-    def _match_text_exact(self, text):
-        """Try to match exact text at current position (no alphanumeric check).
-
-        Args:
-            text: Text to match
-
-        Returns:
-            True if matched (and position advanced), False otherwise
-        """
-        end_pos = self.pos + len(text)
-        if end_pos > len(self.content):
-            return False
+        content = self.content
+        pos = self.pos
 
-        if self.content[self.pos:end_pos] == text:
-            self.pos = end_pos
-            return True
-
-        return False
-
-    def _match_keyword_with_state(self):
-        """Try to match keywords: SI, S, T, END.
-
-        Returns:
-            True if keyword matched, False otherwise
-        """
-        # Check for SI first (must come before S)
-        if self._match_text("SI"):
-            self._emit_token(TokenType.SI, "SI")
-            return True
-
-        # Check for single-letter keywords
-        if self._current_char() == 'S' and not self._is_alphanumeric(self._peek_char()):
-            self._emit_token(TokenType.S, "S")
-            self._advance()
-            return True
-
-        if self._current_char() == 'T' and not self._is_alphanumeric(self._peek_char()):
-            self._emit_token(TokenType.T, "T")
-            self._advance()
-            return True
-
-        # Check for END
-        if self._match_text("END"):
-            self._emit_token(TokenType.END, "END")
-            return True
-
-        return False
-
-    def _match_text(self, text):
-        """Try to match exact text at current position.
-
-        Args:
-            text: Text to match
-
-        Returns:
-            True if matched (and position advanced), False otherwise
-        """
-        end_pos = self.pos + len(text)
-        if end_pos > len(self.content):
-            return False
-
-        # Check exact match
-        if self.content[self.pos:end_pos] == text:
-            # Ensure not part of longer identifier
-            if end_pos < len(self.content) and self._is_alphanumeric(self.content[end_pos]):
-                return False
-            self.pos = end_pos
-            return True
+        # One table lookup on the first character, then the candidates
+        # longest first; str.startswith compares in place without slicing
+        for text, token_type in _OPERATORS_BY_FIRST_CHAR.get(content[pos], ()):
+            if content.startswith(text, pos):
+                self._emit_token(token_type, text)
+                self.pos = pos + len(text)
+                return True
 
         return False
 
@@ -391,9 +395,10 @@ class Tokenizer:
         Returns:
             True if alphanumeric or underscore, False otherwise
         """
-        if char is None:
-            return False
-        return char.isalnum() or char == '_'
+        if char in _ASCII_WORD_CHARS:
+            return True
+        # Non-ASCII letters and digits keep str.isalnum() semantics
+        return char is not None and char.isalnum()
 
     def _match_delimiter_except_lparen(self):
         """Try to match delimiters: ), ,
@@ -403,15 +408,15 @@ class Tokenizer:
         Returns:
             True if delimiter matched, False otherwise
         """
-        char = self._current_char()
+        char = self.content[self.pos]
 
         if char == ')':
-            self._emit_token(TokenType.RPAREN, ')')
-            self._advance()
+            self._emit_token(_TT_RPAREN, ')')
+            self.pos += 1
             return True
         elif char == ',':
-            self._emit_token(TokenType.COMMA, ',')
-            self._advance()
+            self._emit_token(_TT_COMMA, ',')
+            self.pos += 1
             return True
 
         return False
@@ -422,15 +427,18 @@ class Tokenizer:
         Returns:
             True if number matched, False otherwise
         """
-        if not self._current_char().isdigit():
+        content = self.content
+        start_pos = self.pos
+        if not content[start_pos].isdigit():
             return False
 
-        start_pos = self.pos
-        while not self._at_end() and self._current_char().isdigit():
-            self._advance()
+        end_pos = _ASCII_DIGITS.match(content, start_pos).end()
+        while end_pos < self.length and content[end_pos].isdigit():
+            end_pos += 1
+        self.pos = end_pos
 
         number_str = self.content[start_pos:self.pos]
-        self._emit_token(TokenType.NUMBER, int(number_str))
+        self._emit_token(_TT_NUMBER, int(number_str))
         return True
 
     def _capture_until(self, delimiters):
@@ -442,32 +450,63 @@ class Tokenizer:
         Returns:
             Captured string (stripped of leading/trailing whitespace)
         """
-        result = []
+        content = self.content
+        pos = self.pos
+
+        # Fast path: no parenthesis to balance before the first stop on this line.
+        # Searches are bounded by the newline so each call stays on one line.
+        line_end = content.find('\n', pos)
+        if line_end == -1:
+            line_end = self.length
+        stop = line_end
+        for char in ('(', ')', *delimiters):
+            index = content.find(char, pos, stop)
+            if index != -1:
+                stop = index
+        if stop == line_end or (content[stop] != '(' and content[stop] in delimiters):
+            self.pos = stop
+            return content[pos:stop].strip()
+
+        # Nested parentheses: track depth character by character
         paren_depth = 0
+        end_pos = pos
+        length = self.length
 
-        while not self._at_end():
-            char = self._current_char()
+        while end_pos < length:
+            char = content[end_pos]
 
             # Track parenthesis depth
             if char == '(':
                 paren_depth += 1
-                result.append(char)
-                self._advance()
             elif char == ')':
                 if paren_depth == 0 and ')' in delimiters:
                     # End delimiter found
                     break
                 paren_depth -= 1
-                result.append(char)
-                self._advance()
             elif char in delimiters and paren_depth == 0:
                 # Delimiter found at top level
                 break
             elif char == '\n':
                 # Newline in action/condition - error will be handled by parser
                 break
-            else:
-                result.append(char)
-                self._advance()
-
-        return ''.join(result).strip()
+            end_pos += 1
+
+        self.pos = end_pos
+        return content[pos:end_pos].strip()
+
+
+# First-character dispatch for Tokenizer.tokenize(). Characters not listed
+# (non-ASCII letters or digits, invalid input) go to Tokenizer._handle_other.
+_DISPATCH = dict.fromkeys(string.ascii_letters, Tokenizer._match_name)
+_DISPATCH.update(dict.fromkeys(string.digits, Tokenizer._match_number))
+_DISPATCH.update(dict.fromkeys(_OPERATORS_BY_FIRST_CHAR, Tokenizer._handle_operator))
+_DISPATCH.update(dict.fromkeys('),', Tokenizer._match_delimiter_except_lparen))
+_DISPATCH.update({
+    'S': Tokenizer._handle_s,
+    'T': Tokenizer._handle_t,
+    'E': Tokenizer._handle_e,
+    '#': Tokenizer._handle_comment,
+    '\n': Tokenizer._handle_newline,
+    '@': Tokenizer._handle_at,
+    '(': Tokenizer._handle_lparen,
+})